@@ -0,0 +1,154 @@
+import functools
+import pathlib
+import time
+from collections import defaultdict
+from typing import Any
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from itemloaders.common import wrap_loader_context
+from scrapy import Request
+from scrapy.http import HtmlResponse
+from scrapy.loader import ItemLoader
+
+from hardware_scraper.items import parse_quantity
+from hardware_scraper.items import parse_release_date_on
+from hardware_scraper.items import parse_release_date_parts
+
+FIXTURES_DIR = pathlib.Path(__file__).parent.joinpath("benchmark_fixtures")
+LISTING_URL = (
+    "https://www.techpowerup.com/{spider}-specs/?mfgr=AMD&released=2020&sort=name"
+)
+DETAILS_URL = "https://www.techpowerup.com/{spider}-specs/{name}"
+# callbacks of listing pages with their arguments
+LISTING_CALLBACKS = {
+    "parse_manufacturer_year": {"manufacturer": "AMD", "release_year": 2020},
+    "parse_generation": {},
+}
+DETAILS_EXTRACTOR_METHODS = ("sections", "tables", "extract")
+# caches are cleared before every call, so the same pages don't make them warm
+CACHED_FUNCTIONS = (parse_quantity, parse_release_date_parts, parse_release_date_on)
+
+
+def load_fixtures(spider_name: str, kind: str) -> List[HtmlResponse]:
+    """Load fixture pages `<spider>_<kind>_<number>.html` as responses."""
+    responses = []
+    for path in sorted(FIXTURES_DIR.glob(f"{spider_name}_{kind}_*.html")):
+        if kind == "listing":
+            url = LISTING_URL.format(spider=spider_name)
+        else:
+            url = DETAILS_URL.format(spider=spider_name, name=path.stem)
+        responses.append(
+            HtmlResponse(
+                url=url, body=path.read_bytes(), encoding="utf-8", request=Request(url)
+            )
+        )
+    return responses
+
+
+class RecordingItemLoader(ItemLoader):
+    """Records values added to fields to benchmark their input processors."""
+
+    def __init__(self, records: List[Tuple[str, Any]], **kwargs):
+        super().__init__(**kwargs)
+        self.records = records
+
+    def add_value(self, field_name, value, *processors, **kw):
+        self.records.append((field_name, value))
+        super().add_value(field_name, value, *processors, **kw)
+
+
+def time_call(function, *args, **kwargs) -> float:
+    for cached_function in CACHED_FUNCTIONS:
+        cached_function.cache_clear()
+    start = time.perf_counter()
+    function(*args, **kwargs)
+    return time.perf_counter() - start
+
+
+def _consume(callback, response, **kwargs):
+    return list(callback(response, **kwargs))
+
+
+def benchmark_callback(callback, responses, repeat, **kwargs) -> Dict[str, float]:
+    # selectors are cached in responses, so every call gets a new one
+    fresh = [response.replace() for _ in range(repeat) for response in responses]
+    seconds = sum(time_call(_consume, callback, r, **kwargs) for r in fresh)
+    return {
+        "pages": len(responses),
+        "pages_per_sec": len(fresh) / seconds,
+        "us_per_page": seconds / len(fresh) * 1e6,
+    }
+
+
+def benchmark_details_extractor(extractor, responses, repeat) -> Dict[str, Dict]:
+    results = {}
+    for method in DETAILS_EXTRACTOR_METHODS:
+        fresh = [response.replace() for _ in range(repeat) for response in responses]
+        if method == "tables":
+            arguments = [extractor.sections(response) for response in fresh]
+        else:
+            arguments = fresh
+        function = getattr(extractor, method)
+        seconds = sum(time_call(function, argument) for argument in arguments)
+        results[method] = {"us_per_page": seconds / len(arguments) * 1e6}
+    return results
+
+
+def benchmark_processors(loader, records, repeat) -> Dict[str, Dict]:
+    seconds = defaultdict(float)
+    counts = defaultdict(int)
+    for field, value in records:
+        processor = wrap_loader_context(
+            loader.get_input_processor(field), loader.context
+        )
+        for _ in range(repeat):
+            seconds[field] += time_call(processor, value)
+        counts[field] += 1
+    return {
+        field: {
+            "values": counts[field],
+            "us_per_value": seconds[field] / (counts[field] * repeat) * 1e6,
+        }
+        for field in sorted(seconds)
+    }
+
+
+def benchmark_spider(spider_cls, repeat: int = 100) -> Dict[str, Any]:
+    """Time callbacks, details extractor and input processors on fixture pages.
+
+    Callbacks are timed on the whole pages, input processors on the values
+    added to item loaders while parsing detail pages.
+    """
+    spider = spider_cls()
+    listings = load_fixtures(spider.name, "listing")
+    details = load_fixtures(spider.name, "detail")
+    callbacks = {}
+    if listings:
+        for name, kwargs in LISTING_CALLBACKS.items():
+            callbacks[name] = benchmark_callback(
+                getattr(spider, name), listings, repeat, **kwargs
+            )
+    if not details:
+        return {"callbacks": callbacks}
+
+    details_callback = getattr(spider, spider.details_callback)
+    callbacks[spider.details_callback] = benchmark_callback(
+        details_callback, details, repeat
+    )
+
+    records = []
+    spider.loader_cls = functools.partial(RecordingItemLoader, records)
+    items = [
+        item for response in details for item in _consume(details_callback, response)
+    ]
+    return {
+        "callbacks": callbacks,
+        "details_extractor": benchmark_details_extractor(
+            spider.details_extractor, details, repeat
+        ),
+        "processors": benchmark_processors(
+            ItemLoader(item=type(items[0])()), records, repeat
+        ),
+    }
@@ -0,0 +1,193 @@
+import gzip
+import os
+import pickle
+import shutil
+import sqlite3
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from http import HTTPStatus
+from typing import Iterable
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+from typing import Sequence
+from typing import Tuple
+
+from hardware_scraper.httpcache import connect
+from hardware_scraper.httpcache import iter_filesystem_cache
+
+OK_STATUS_CODES = (HTTPStatus.OK,)
+
+INDEX_FILENAME = "index.sqlite"
+INDEX_SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    spider TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    url TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    timestamp REAL NOT NULL,
+    size INTEGER NOT NULL,
+    PRIMARY KEY (spider, fingerprint)
+) WITHOUT ROWID
+"""
+INDEXES = (
+    "CREATE INDEX IF NOT EXISTS responses_status ON responses (status)",
+    "CREATE INDEX IF NOT EXISTS responses_url ON responses (url)",
+)
+
+
+class CacheEntry(NamedTuple):
+    spider: str
+    fingerprint: str
+    url: str
+    status: int
+    timestamp: float
+    size: int
+
+
+def build_filter(
+    spider: Optional[str] = None,
+    errors: bool = False,
+    listing_url_prefixes: Sequence[str] = (),
+) -> Tuple[str, list]:
+    """Build WHERE clause selecting cache entries.
+
+    Listing pages are selected by `HardwareSpider.get_listing_url_prefix()` of
+    spiders.
+    """
+    conditions = []
+    params = []
+    if spider is not None:
+        conditions.append("spider = ?")
+        params.append(spider)
+    if errors:
+        placeholders = ", ".join("?" for _ in OK_STATUS_CODES)
+        conditions.append(f"status NOT IN ({placeholders})")
+        params.extend(int(status) for status in OK_STATUS_CODES)
+    if listing_url_prefixes:
+        # prefix match as a range, so the index on url is used
+        conditions.append(
+            "("
+            + " OR ".join("(url >= ? AND url < ?)" for _ in listing_url_prefixes)
+            + ")"
+        )
+        for prefix in listing_url_prefixes:
+            params.extend([prefix, prefix[:-1] + chr(ord(prefix[-1]) + 1)])
+
+    where = " AND ".join(conditions) if conditions else "1"
+    return where, params
+
+
+class CacheIndex:
+    """Metadata index of cached responses: url, status, timestamp, spider, size."""
+
+    def __init__(self, db: sqlite3.Connection):
+        self.db = db
+        for query in INDEXES:
+            self.db.execute(query)
+
+    def close(self):
+        self.db.close()
+
+    def select(self, **filters) -> List[CacheEntry]:
+        where, params = build_filter(**filters)
+        rows = self.db.execute(
+            "SELECT spider, fingerprint, url, status, timestamp, size FROM responses "
+            f"WHERE {where} ORDER BY spider, url",
+            params,
+        )
+        return [CacheEntry(*row) for row in rows]
+
+    def count_statuses(self, spider: Optional[str] = None) -> Counter:
+        where, params = build_filter(spider=spider)
+        rows = self.db.execute(
+            f"SELECT status, COUNT(*) FROM responses WHERE {where} GROUP BY status",
+            params,
+        )
+        return Counter(dict(rows))
+
+    def remove(self, entries: Iterable[CacheEntry]):
+        keys = [(entry.spider, entry.fingerprint) for entry in entries]
+        self._remove_entries(keys)
+        with self.db:
+            self.db.executemany(
+                "DELETE FROM responses WHERE spider = ? AND fingerprint = ?", keys
+            )
+
+    def _remove_entries(self, keys):
+        pass
+
+
+class SqliteCacheIndex(CacheIndex):
+    """Index of SqliteCacheStorage, it is the cache database itself."""
+
+    def __init__(self, dbpath):
+        super().__init__(connect(dbpath))
+
+
+class FilesystemCacheIndex(CacheIndex):
+    """Persistent index of FilesystemCacheStorage kept next to the cache.
+
+    Only entries that aren't in the index yet are read on update, meta files are
+    read in parallel.
+    """
+
+    def __init__(self, cachedir, gzipped=False, workers=16):
+        db = sqlite3.connect(os.path.join(cachedir, INDEX_FILENAME))
+        db.execute(INDEX_SCHEMA)
+        super().__init__(db)
+        self.cachedir = cachedir
+        self.open_file = gzip.open if gzipped else open
+        self.workers = workers
+
+    def rebuild(self) -> Tuple[int, int]:
+        with self.db:
+            self.db.execute("DELETE FROM responses")
+        return self.update()
+
+    def update(self) -> Tuple[int, int]:
+        """Synchronize index with the cache directory.
+
+        Returns the numbers of added and removed entries.
+        """
+        paths = {
+            (spider, fingerprint): rpath
+            for spider, fingerprint, rpath in iter_filesystem_cache(self.cachedir)
+        }
+        indexed = set(self.db.execute("SELECT spider, fingerprint FROM responses"))
+        removed = [key for key in indexed if key not in paths]
+        added = [key for key in paths if key not in indexed]
+
+        with ThreadPoolExecutor(max_workers=self.workers) as executor:
+            entries = executor.map(
+                lambda key: self._read_entry(*key, paths[key]), added
+            )
+            entries = [entry for entry in entries if entry is not None]
+
+        with self.db:
+            self.db.executemany(
+                "DELETE FROM responses WHERE spider = ? AND fingerprint = ?", removed
+            )
+            self.db.executemany(
+                "INSERT OR REPLACE INTO responses VALUES (?, ?, ?, ?, ?, ?)", entries
+            )
+        return len(entries), len(removed)
+
+    def _read_entry(self, spider, fingerprint, rpath) -> Optional[CacheEntry]:
+        metapath = os.path.join(rpath, "pickled_meta")
+        try:
+            with self.open_file(metapath, "rb") as f:
+                metadata = pickle.load(f)
+            timestamp = os.stat(metapath).st_mtime
+            size = os.stat(os.path.join(rpath, "response_body")).st_size
+        except FileNotFoundError:
+            # entry is being written or it is broken
+            return None
+        return CacheEntry(
+            spider, fingerprint, metadata["url"], metadata["status"], timestamp, size
+        )
+
+    def _remove_entries(self, keys):
+        for spider, fingerprint in keys:
+            rpath = os.path.join(self.cachedir, spider, fingerprint[0:2], fingerprint)
+            shutil.rmtree(rpath, ignore_errors=True)
@@ -0,0 +1,4 @@
+# This package will contain the custom commands of your Scrapy project
+#
+# Please refer to the documentation for information on how to create commands:
+# https://docs.scrapy.org/en/latest/topics/commands.html#custom-project-commands
@@ -0,0 +1,59 @@
+import json
+import os
+import platform
+
+import scrapy
+from scrapy.commands import ScrapyCommand
+
+from hardware_scraper.benchmark import benchmark_spider
+
+
+class Command(ScrapyCommand):
+
+    requires_project = True
+    default_settings = {"LOG_LEVEL": "WARNING"}
+
+    def syntax(self):
+        return "[spider ...] [options]"
+
+    def short_desc(self):
+        return "Benchmark parsing of fixture pages without crawling"
+
+    def long_desc(self):
+        return (
+            "Time spider callbacks, details extractor and input processors of items "
+            "on fixture pages in `hardware_scraper/benchmark_fixtures`. "
+            "Results (pages/sec, µs per page and per field value) are written as JSON."
+        )
+
+    def add_options(self, parser):
+        ScrapyCommand.add_options(self, parser)
+        parser.add_argument(
+            "-o", "--output", metavar="FILE", help="write results into FILE"
+        )
+        parser.add_argument(
+            "--repeat",
+            type=int,
+            default=100,
+            help="number of times each page and value is parsed (default: 100)",
+        )
+
+    def run(self, args, opts):
+        spider_loader = self.crawler_process.spider_loader
+        spider_names = args or sorted(spider_loader.list())
+        results = {
+            "python": platform.python_version(),
+            "scrapy": scrapy.__version__,
+            "repeat": opts.repeat,
+            "spiders": {
+                name: benchmark_spider(spider_loader.load(name), repeat=opts.repeat)
+                for name in spider_names
+            },
+        }
+        if opts.output is None:
+            print(json.dumps(results, indent=2))
+            return
+        os.makedirs(os.path.dirname(os.path.abspath(opts.output)), exist_ok=True)
+        with open(opts.output, "w") as f:
+            json.dump(results, f, indent=2)
+        print(f"Results are written into {opts.output}")
@@ -0,0 +1,128 @@
+import os
+
+from scrapy.commands import ScrapyCommand
+from scrapy.exceptions import UsageError
+from scrapy.utils.misc import load_object
+from scrapy.utils.project import data_path
+
+from hardware_scraper.cache_index import FilesystemCacheIndex
+from hardware_scraper.cache_index import SqliteCacheIndex
+from hardware_scraper.httpcache import DB_FILENAME
+from hardware_scraper.httpcache import SqliteCacheStorage
+from hardware_scraper.spiders.base import HardwareSpider
+
+ACTIONS = ("stats", "remove")
+
+
+class Command(ScrapyCommand):
+
+    requires_project = True
+    default_settings = {"LOG_ENABLED": False}
+
+    def syntax(self):
+        return "stats|remove [options]"
+
+    def short_desc(self):
+        return "Show statistics of HTTP cache or remove selected responses from it"
+
+    def long_desc(self):
+        return (
+            "Show statistics of HTTP cache or remove selected responses from it. "
+            "Works with the storage from HTTPCACHE_STORAGE setting, "
+            "metadata of FilesystemCacheStorage is indexed in HTTPCACHE_DIR."
+        )
+
+    def add_options(self, parser):
+        ScrapyCommand.add_options(self, parser)
+        parser.add_argument("--spider", help="process only cache of this spider")
+        parser.add_argument(
+            "--errors", action="store_true", help="select responses with non-OK status"
+        )
+        parser.add_argument(
+            "--listing-pages", action="store_true", help="select listing pages"
+        )
+        parser.add_argument(
+            "--dry-run", action="store_true", help="only list selected responses"
+        )
+        parser.add_argument(
+            "-y", "--yes", action="store_true", help="remove without confirmation"
+        )
+        parser.add_argument(
+            "--rebuild", action="store_true", help="rebuild filesystem cache index"
+        )
+        parser.add_argument(
+            "--workers",
+            type=int,
+            default=16,
+            help="number of threads to read filesystem cache metadata (default: 16)",
+        )
+
+    def run(self, args, opts):
+        if len(args) != 1 or args[0] not in ACTIONS:
+            raise UsageError()
+        action = args[0]
+        if action == "remove" and not (opts.errors or opts.listing_pages):
+            raise UsageError("Select responses to remove: --errors, --listing-pages")
+
+        index = self._open_index(opts)
+        try:
+            if action == "stats":
+                self._print_stats(index, opts)
+            else:
+                self._remove(index, opts)
+        finally:
+            index.close()
+
+    def _open_index(self, opts):
+        cachedir = data_path(self.settings["HTTPCACHE_DIR"], createdir=True)
+        storage_cls = load_object(self.settings["HTTPCACHE_STORAGE"])
+        if issubclass(storage_cls, SqliteCacheStorage):
+            return SqliteCacheIndex(os.path.join(cachedir, DB_FILENAME))
+
+        index = FilesystemCacheIndex(
+            cachedir=cachedir,
+            gzipped=self.settings.getbool("HTTPCACHE_GZIP"),
+            workers=opts.workers,
+        )
+        added, removed = index.rebuild() if opts.rebuild else index.update()
+        print(f"Index updated: {added} entries added, {removed} entries removed")
+        return index
+
+    def _print_stats(self, index, opts):
+        status_counter = index.count_statuses(spider=opts.spider)
+        for status, count in sorted(status_counter.items()):
+            print(f"Status code {status}: {count}")
+        print(f"Total: {sum(status_counter.values())}")
+
+    def _get_listing_url_prefixes(self, spider_name):
+        spider_loader = self.crawler_process.spider_loader
+        spider_names = [spider_name] if spider_name else spider_loader.list()
+        spider_classes = map(spider_loader.load, spider_names)
+        return [
+            spider_cls.get_listing_url_prefix()
+            for spider_cls in spider_classes
+            if issubclass(spider_cls, HardwareSpider)
+        ]
+
+    def _remove(self, index, opts):
+        listing_url_prefixes = []
+        if opts.listing_pages:
+            listing_url_prefixes = self._get_listing_url_prefixes(opts.spider)
+        entries = index.select(
+            spider=opts.spider,
+            errors=opts.errors,
+            listing_url_prefixes=listing_url_prefixes,
+        )
+        for entry in entries:
+            print(f"Cache on url: {entry.url} with status code: {entry.status}")
+        print(f"Selected {len(entries)} responses")
+
+        if opts.dry_run or not entries:
+            return
+        if not opts.yes:
+            answer = input("Do you want to remove listed responses: Y/N [N]: ")
+            if answer != "Y":
+                print("Not removing")
+                return
+        index.remove(entries)
+        print(f"Removed {len(entries)} responses")
@@ -0,0 +1,47 @@
+import os
+
+from scrapy.commands import ScrapyCommand
+from scrapy.exceptions import UsageError
+from scrapy.utils.project import data_path
+
+from hardware_scraper.httpcache import DB_FILENAME
+from hardware_scraper.httpcache import import_filesystem_cache
+
+
+class Command(ScrapyCommand):
+
+    requires_project = True
+    default_settings = {"LOG_ENABLED": False}
+
+    def syntax(self):
+        return "[options]"
+
+    def short_desc(self):
+        return "Import filesystem HTTP cache into SQLite cache storage"
+
+    def add_options(self, parser):
+        ScrapyCommand.add_options(self, parser)
+        parser.add_argument(
+            "--source",
+            help="directory of FilesystemCacheStorage (default: HTTPCACHE_DIR)",
+        )
+        parser.add_argument(
+            "--target",
+            help=f"SQLite database (default: HTTPCACHE_DIR/{DB_FILENAME})",
+        )
+
+    def run(self, args, opts):
+        cachedir = opts.source or data_path(self.settings["HTTPCACHE_DIR"])
+        dbpath = opts.target or os.path.join(cachedir, DB_FILENAME)
+        if not os.path.isdir(cachedir):
+            raise UsageError(f"Cache directory doesn't exist: {cachedir}")
+
+        count = import_filesystem_cache(
+            cachedir=cachedir,
+            dbpath=dbpath,
+            compression_level=self.settings.getint(
+                "HTTPCACHE_SQLITE_COMPRESSION_LEVEL"
+            ),
+            gzipped=self.settings.getbool("HTTPCACHE_GZIP"),
+        )
+        print(f"Imported {count} responses from {cachedir} into {dbpath}")
@@ -0,0 +1,100 @@
+import os
+
+from scrapy.commands import ScrapyCommand
+from scrapy.exceptions import UsageError
+from scrapy.exporters import JsonLinesItemExporter
+from scrapy.utils.misc import load_object
+from scrapy.utils.project import data_path
+
+from hardware_scraper.httpcache import DB_FILENAME
+from hardware_scraper.httpcache import SqliteCacheStorage
+from hardware_scraper.pipelines import BatchingPipeline
+from hardware_scraper.reparse import iter_filesystem_cache_responses
+from hardware_scraper.reparse import iter_sqlite_cache
+from hardware_scraper.reparse import reparse
+
+
+class Command(ScrapyCommand):
+
+    requires_project = True
+    default_settings = {"LOG_LEVEL": "INFO"}
+
+    def syntax(self):
+        return "<spider> -o|-O FILE [options]"
+
+    def short_desc(self):
+        return "Extract items from cached detail pages without crawling"
+
+    def long_desc(self):
+        return (
+            "Extract items from detail pages in HTTP cache without crawling. "
+            "Pages are parsed by the spider callback in a process pool, "
+            "items are written as JSON lines like in `scrapy crawl -o`."
+        )
+
+    def add_options(self, parser):
+        ScrapyCommand.add_options(self, parser)
+        parser.add_argument(
+            "-o", "--output", metavar="FILE", help="append scraped items to FILE"
+        )
+        parser.add_argument(
+            "-O",
+            "--overwrite-output",
+            metavar="FILE",
+            help="dump scraped items into FILE, overwriting it",
+        )
+        parser.add_argument(
+            "--processes",
+            type=int,
+            default=None,
+            help="number of parsing processes (default: number of CPUs)",
+        )
+        parser.add_argument(
+            "--batch-size",
+            type=int,
+            default=1000,
+            help="number of responses sent to processes at once (default: 1000)",
+        )
+
+    def run(self, args, opts):
+        if len(args) != 1:
+            raise UsageError()
+        if not (opts.output or opts.overwrite_output):
+            raise UsageError("Output file is required: -o or -O")
+
+        spider_cls = self.crawler_process.spider_loader.load(args[0])
+        responses = self._iter_responses(spider_cls)
+        crawler = self.crawler_process.create_crawler(spider_cls)
+        spider = spider_cls.from_crawler(crawler)
+        pipeline = BatchingPipeline.from_crawler(crawler)
+        pipeline.open_spider(spider)
+
+        path = opts.overwrite_output or opts.output
+        mode = "wb" if opts.overwrite_output else "ab"
+        os.makedirs(os.path.dirname(os.path.abspath(path)), exist_ok=True)
+        count = 0
+        with open(path, mode) as f:
+            exporter = JsonLinesItemExporter(
+                f, encoding=self.settings.get("FEED_EXPORT_ENCODING")
+            )
+            exporter.start_exporting()
+            for item in reparse(
+                spider_cls,
+                responses,
+                processes=opts.processes,
+                batch_size=opts.batch_size,
+            ):
+                exporter.export_item(pipeline.process_item(item, spider))
+                count += 1
+            exporter.finish_exporting()
+        pipeline.spider_closed(spider)
+        print(f"Extracted {count} items into {path}")
+
+    def _iter_responses(self, spider_cls):
+        cachedir = data_path(self.settings["HTTPCACHE_DIR"])
+        storage_cls = load_object(self.settings["HTTPCACHE_STORAGE"])
+        if issubclass(storage_cls, SqliteCacheStorage):
+            return iter_sqlite_cache(os.path.join(cachedir, DB_FILENAME), spider_cls)
+        return iter_filesystem_cache_responses(
+            cachedir, spider_cls, gzipped=self.settings.getbool("HTTPCACHE_GZIP")
+        )
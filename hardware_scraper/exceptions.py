@@ -0,0 +1,5 @@
+from scrapy.exceptions import DropItem
+
+
+class UnchangedItem(DropItem):
+    """Item is the same as on the previous crawl."""
@@ -0,0 +1,115 @@
+from typing import Dict
+from typing import List
+
+from itemadapter import ItemAdapter
+from scrapy.exporters import BaseItemExporter
+
+try:
+    import pyarrow as pa
+    import pyarrow.parquet as pq
+except ImportError:
+    pa = None
+    pq = None
+
+
+def get_arrow_type(dtype):
+    return {
+        str: pa.string(),
+        int: pa.int64(),
+        float: pa.float64(),
+        bool: pa.bool_(),
+        list: pa.list_(pa.string()),
+    }[dtype]
+
+
+def get_arrow_schema(item_cls, fields_to_export=None) -> "pa.Schema":
+    """Build arrow schema from `dtype` and `unit` metadata of item fields."""
+    names = fields_to_export or list(item_cls.fields)
+    fields = []
+    for name in names:
+        field = item_cls.fields[name]
+        metadata = {"unit": field["unit"]} if "unit" in field else None
+        arrow_type = get_arrow_type(field.get("dtype", str))
+        fields.append(pa.field(name, arrow_type, metadata=metadata))
+    return pa.schema(fields)
+
+
+class ColumnarItemExporter(BaseItemExporter):
+    """Base exporter collecting items into columns and writing them by batches.
+
+    Schema is taken from the class of the first exported item, missing fields
+    are written as nulls. Feeds without items get the schema of `item_cls` of
+    the spider. Size of batches is set in `item_export_kwargs` of the feed,
+    e.g. `{"format": "parquet", "item_export_kwargs": {"batch_size": 1000}}`.
+    """
+
+    def __init__(self, file, **kwargs):
+        if pa is None:
+            raise ImportError(
+                f"pyarrow is required for {type(self).__name__}, "
+                "install the `columnar` extra: pip install '.[columnar]'"
+            )
+        # number of rows in a row group (parquet) or a record batch (arrow)
+        self.batch_size = kwargs.pop("batch_size", 10000)
+        self.item_cls = kwargs.pop("item_cls", None)
+        super().__init__(dont_fail=True, **kwargs)
+        self.file = file
+        self.schema = None
+        self.writer = None
+        self.columns: Dict[str, List] = {}
+        self.buffered_rows = 0
+
+    @classmethod
+    def from_crawler(cls, crawler, file, **kwargs):
+        kwargs.setdefault("item_cls", getattr(crawler.spider, "item_cls", None))
+        return cls(file, **kwargs)
+
+    def _set_schema(self, item_cls):
+        self.schema = get_arrow_schema(item_cls, self.fields_to_export)
+        self.columns = {name: [] for name in self.schema.names}
+
+    def export_item(self, item):
+        if self.schema is None:
+            self._set_schema(type(item))
+        adapter = ItemAdapter(item)
+        for name, column in self.columns.items():
+            column.append(adapter.get(name))
+        self.buffered_rows += 1
+        if self.buffered_rows >= self.batch_size:
+            self._flush()
+
+    def finish_exporting(self):
+        if self.schema is None:
+            if self.item_cls is None:
+                return
+            # an empty table is written, so the file is valid
+            self._set_schema(self.item_cls)
+        if self.buffered_rows or self.writer is None:
+            self._flush()
+        self.writer.close()
+
+    def _flush(self):
+        batch = pa.RecordBatch.from_pydict(self.columns, schema=self.schema)
+        if self.writer is None:
+            self.writer = self._open_writer()
+        self.writer.write_batch(batch)
+        for column in self.columns.values():
+            column.clear()
+        self.buffered_rows = 0
+
+    def _open_writer(self):
+        raise NotImplementedError
+
+
+class ParquetItemExporter(ColumnarItemExporter):
+    """Writes items into parquet file, batches are written as row groups."""
+
+    def _open_writer(self):
+        return pq.ParquetWriter(self.file, self.schema)
+
+
+class ArrowItemExporter(ColumnarItemExporter):
+    """Writes items into arrow IPC file, it can be memory-mapped without copying."""
+
+    def _open_writer(self):
+        return pa.ipc.new_file(self.file, self.schema)
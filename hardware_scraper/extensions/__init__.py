@@ -0,0 +1,10 @@
+from hardware_scraper.extensions.catalog import CachedGenerations
+from hardware_scraper.extensions.catalog import GenerationCatalog
+from hardware_scraper.extensions.incremental import IncrementalCrawl
+from hardware_scraper.extensions.incremental import ScrapedIndex
+from hardware_scraper.extensions.listing import ListingFingerprints
+from hardware_scraper.extensions.listing import ListingIndex
+from hardware_scraper.extensions.metrics import MetricsExporter
+from hardware_scraper.extensions.profiling import ProcessorProfile
+from hardware_scraper.extensions.profiling import ProcessorProfiling
+from hardware_scraper.extensions.profiling import ProfilingItemLoader
@@ -0,0 +1,102 @@
+import datetime
+import pathlib
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+
+from hardware_scraper.extensions.utils import load_json
+from hardware_scraper.extensions.utils import save_json
+
+
+class GenerationCatalog:
+    """Persistent catalog of generations released by manufacturers in each year.
+
+    Years without generations are kept with empty lists, so they aren't
+    requested again. Entries are trusted only if they were recorded after
+    the end of their year.
+    """
+
+    def __init__(self, path: pathlib.Path, refresh_days: Optional[float] = None):
+        self.path = path
+        self.refresh_days = refresh_days
+        self.catalog: Dict[str, Dict] = {}
+
+    @staticmethod
+    def _get_key(manufacturer: str, year: int) -> str:
+        return f"{manufacturer}/{year}"
+
+    def load(self):
+        self.catalog = load_json(self.path, default={})
+
+    def save(self):
+        save_json(self.path, self.catalog)
+
+    def add(self, manufacturer: str, year: int, generations: List[str]):
+        self.catalog[self._get_key(manufacturer, year)] = {
+            "generations": sorted(generations),
+            "updated": datetime.datetime.now().isoformat(),
+        }
+
+    def get_generations(self, manufacturer: str, year: int) -> Optional[List[str]]:
+        """Get generations of the year, None if they should be requested."""
+        if year >= datetime.date.today().year:
+            # new generations can be released this year
+            return None
+        entry = self.catalog.get(self._get_key(manufacturer, year))
+        if entry is None:
+            return None
+        updated = datetime.datetime.fromisoformat(entry["updated"])
+        if updated.year <= year:
+            # generations can be released after the entry in the same year
+            return None
+        if self.refresh_days is not None:
+            age = datetime.datetime.now() - updated
+            if age >= datetime.timedelta(days=self.refresh_days):
+                return None
+        return entry["generations"]
+
+
+class CachedGenerations:
+    """Lets spiders skip listing pages of years with known generations.
+
+    The catalog is kept in `GENERATION_CATALOG_DIR/<spider>.json`. Generation
+    pages of past years are requested right away, years without generations
+    are skipped, pages of the current year and years recorded before their end
+    are always requested.
+    """
+
+    def __init__(self, directory: pathlib.Path, refresh_days: Optional[float]):
+        self.directory = directory
+        self.refresh_days = refresh_days
+        self.catalog = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        if not settings.getbool("GENERATION_CATALOG_ENABLED"):
+            raise NotConfigured
+        refresh_days = settings.get("GENERATION_CATALOG_REFRESH_DAYS")
+        if refresh_days is not None:
+            refresh_days = float(refresh_days)
+
+        ext = cls(
+            directory=pathlib.Path(settings.get("GENERATION_CATALOG_DIR")),
+            refresh_days=refresh_days,
+        )
+        crawler.signals.connect(ext.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(ext.spider_closed, signal=signals.spider_closed)
+        return ext
+
+    def spider_opened(self, spider):
+        self.catalog = GenerationCatalog(
+            path=self.directory.joinpath(f"{spider.name}.json"),
+            refresh_days=self.refresh_days,
+        )
+        self.catalog.load()
+        spider.generation_catalog = self.catalog
+
+    def spider_closed(self, spider):
+        self.catalog.save()
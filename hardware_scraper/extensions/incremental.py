@@ -0,0 +1,154 @@
+import datetime
+import pathlib
+from typing import Dict
+from typing import List
+from typing import Optional
+
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+
+from hardware_scraper.exceptions import UnchangedItem
+from hardware_scraper.extensions.utils import load_json
+from hardware_scraper.extensions.utils import save_json
+from hardware_scraper.pipelines.batching_pipeline import BatchingPipeline
+from hardware_scraper.signals import items_flushed
+
+
+class ScrapedIndex:
+    """Compact index of detail pages that are already scraped: url -> timestamp."""
+
+    def __init__(self, path: pathlib.Path, refresh_days: Optional[float] = None):
+        self.path = path
+        self.refresh_days = refresh_days
+        self.scraped: Dict[str, datetime.datetime] = {}
+
+    def load(self):
+        scraped = load_json(self.path, default={})
+        self.scraped = {
+            url: datetime.datetime.fromisoformat(timestamp)
+            for url, timestamp in scraped.items()
+        }
+
+    def save(self):
+        scraped = {
+            url: timestamp.isoformat() for url, timestamp in self.scraped.items()
+        }
+        save_json(self.path, scraped)
+
+    def __contains__(self, url: str) -> bool:
+        return url in self.scraped
+
+    def add(self, url: str):
+        self.scraped[url] = datetime.datetime.now()
+
+    def is_fresh(self, url: str) -> bool:
+        timestamp = self.scraped.get(url)
+        if timestamp is None:
+            return False
+        if self.refresh_days is None:
+            return True
+        age = datetime.datetime.now() - timestamp
+        return age < datetime.timedelta(days=self.refresh_days)
+
+
+class IncrementalCrawl:
+    """Lets spiders skip detail pages scraped on previous runs.
+
+    The index of scraped pages is kept in `INCREMENTAL_DIR/<spider>.json`, pages
+    scraped more than `INCREMENTAL_REFRESH_DAYS` ago are scraped again. The index
+    is saved every `INCREMENTAL_SAVE_ITEMS` indexed pages and on spider close.
+
+    With ITEM_SINKS, pages are indexed only after BatchingPipeline flushed their
+    items, so items lost in a crash are scraped again on the next run.
+    """
+
+    def __init__(
+        self,
+        directory: pathlib.Path,
+        refresh_days: Optional[float],
+        save_items: int,
+        stats,
+    ):
+        self.directory = directory
+        self.refresh_days = refresh_days
+        self.save_items = save_items
+        self.stats = stats
+        self.index = None
+        self.unsaved = 0
+        # pages of items that aren't flushed to sinks yet
+        self.unflushed: Optional[List[str]] = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        if not settings.getbool("INCREMENTAL_ENABLED"):
+            raise NotConfigured
+        refresh_days = settings.get("INCREMENTAL_REFRESH_DAYS")
+        if refresh_days is not None:
+            refresh_days = float(refresh_days)
+
+        ext = cls(
+            directory=pathlib.Path(settings.get("INCREMENTAL_DIR")),
+            refresh_days=refresh_days,
+            save_items=settings.getint("INCREMENTAL_SAVE_ITEMS"),
+            stats=crawler.stats,
+        )
+        crawler.signals.connect(ext.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(ext.spider_closed, signal=signals.spider_closed)
+        crawler.signals.connect(ext.item_scraped, signal=signals.item_scraped)
+        crawler.signals.connect(ext.item_dropped, signal=signals.item_dropped)
+        crawler.signals.connect(ext.items_flushed, signal=items_flushed)
+        return ext
+
+    def spider_opened(self, spider):
+        self.index = ScrapedIndex(
+            path=self.directory.joinpath(f"{spider.name}.json"),
+            refresh_days=self.refresh_days,
+        )
+        self.index.load()
+        spider.scraped_index = self.index
+        if self._has_item_sinks(spider):
+            self.unflushed = []
+        spider.logger.info(
+            f"Loaded index of {len(self.index.scraped)} scraped pages "
+            f"from {self.index.path}"
+        )
+
+    def spider_closed(self, spider):
+        self.index.save()
+
+    @staticmethod
+    def _has_item_sinks(spider) -> bool:
+        pipelines = spider.crawler.engine.scraper.itemproc.middlewares
+        return any(
+            isinstance(pipeline, BatchingPipeline) and pipeline.sinks
+            for pipeline in pipelines
+        )
+
+    def item_scraped(self, item, response, spider):
+        if self.unflushed is not None:
+            self.unflushed.append(response.url)
+        else:
+            self._add(response.url, spider)
+
+    def items_flushed(self, items, spider):
+        # items of pages scraped so far are in this batch or in previous ones
+        if not self.unflushed:
+            return
+        urls, self.unflushed = self.unflushed, []
+        for url in urls:
+            self._add(url, spider)
+
+    def _add(self, url: str, spider):
+        self.index.add(url)
+        self.stats.inc_value("incremental/indexed", spider=spider)
+        # a crash shouldn't lose the whole run
+        self.unsaved += 1
+        if self.save_items and self.unsaved >= self.save_items:
+            self.index.save()
+            self.unsaved = 0
+
+    def item_dropped(self, item, response, exception, spider):
+        # unchanged products are scraped too (see ChangeDetectionPipeline)
+        if isinstance(exception, UnchangedItem):
+            self.item_scraped(item, response, spider)
@@ -0,0 +1,130 @@
+import hashlib
+import pathlib
+from typing import Dict
+from typing import List
+from typing import Set
+
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+
+from hardware_scraper.extensions.utils import load_json
+from hardware_scraper.extensions.utils import save_json
+
+
+def get_fingerprint(entries: List[str]) -> str:
+    return hashlib.sha1("\n".join(sorted(set(entries))).encode()).hexdigest()
+
+
+class ListingIndex:
+    """Persistent index of entries (links, generations) seen on listing pages.
+
+    Stores fingerprint of the entry set of each listing url, so unchanged pages
+    are detected without comparing the sets. Followed entries are saved only if
+    their pages are done: detail pages are scraped or dropped, listing pages are
+    parsed with all their followed entries done. Other entries are new again on
+    the next run.
+    """
+
+    def __init__(self, path: pathlib.Path):
+        self.path = path
+        self.listings: Dict[str, Dict] = {}
+        # entries of listing pages seen on this run
+        self.updated: Dict[str, List[str]] = {}
+        # listing url -> {entry: url of the followed page}
+        self.followed: Dict[str, Dict[str, str]] = {}
+        # urls of scraped or dropped detail pages
+        self.done: Set[str] = set()
+
+    def load(self):
+        self.listings = load_json(self.path, default={})
+
+    def save(self):
+        for url, entries in self.updated.items():
+            followed = self.followed.get(url, {})
+            entries = [
+                entry
+                for entry in entries
+                if entry not in followed or self.is_done(followed[entry])
+            ]
+            self.listings[url] = {
+                "fingerprint": get_fingerprint(entries),
+                "entries": entries,
+            }
+        self.updated = {}
+        self.followed = {}
+        save_json(self.path, self.listings)
+
+    def follow(self, url: str, entry: str, followed_url: str):
+        """Record that the entry of the listing page is followed to the page."""
+        self.followed.setdefault(url, {})[entry] = followed_url
+
+    def add_done(self, url: str):
+        self.done.add(url)
+
+    def is_done(self, url: str) -> bool:
+        if url in self.done:
+            return True
+        if url not in self.updated:
+            return False
+        return all(self.is_done(x) for x in self.followed.get(url, {}).values())
+
+    def get_new_entries(self, url: str, entries: List[str]) -> List[str]:
+        """Get entries that weren't on the listing page on previous runs."""
+        fingerprint = get_fingerprint(entries)
+        self.updated[url] = sorted(entries)
+
+        previous = self.listings.get(url)
+        if previous is None:
+            return entries
+        if previous["fingerprint"] == fingerprint:
+            return []
+        known_entries = set(previous["entries"])
+        return [entry for entry in entries if entry not in known_entries]
+
+
+class ListingFingerprints:
+    """Lets spiders follow only new entries of listing pages.
+
+    Listing pages are requested bypassing HTTPCACHE to see the current state of
+    the site. The index is kept in `LISTING_INDEX_DIR/<spider>.json` and it is
+    updated only if the crawl is finished, so interrupted fan-outs are repeated,
+    entries whose pages failed are followed again on the next run.
+    """
+
+    def __init__(self, directory: pathlib.Path, stats):
+        self.directory = directory
+        self.stats = stats
+        self.index = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        if not settings.getbool("LISTING_INDEX_ENABLED"):
+            raise NotConfigured
+
+        ext = cls(
+            directory=pathlib.Path(settings.get("LISTING_INDEX_DIR")),
+            stats=crawler.stats,
+        )
+        crawler.signals.connect(ext.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(ext.spider_closed, signal=signals.spider_closed)
+        crawler.signals.connect(ext.item_scraped, signal=signals.item_scraped)
+        crawler.signals.connect(ext.item_dropped, signal=signals.item_dropped)
+        return ext
+
+    def spider_opened(self, spider):
+        self.index = ListingIndex(path=self.directory.joinpath(f"{spider.name}.json"))
+        self.index.load()
+        spider.listing_index = self.index
+
+    def spider_closed(self, spider, reason):
+        if reason == "finished":
+            self.index.save()
+        else:
+            spider.logger.info(f"Listing index isn't saved, finish reason: {reason}")
+
+    def item_scraped(self, item, response, spider):
+        self.index.add_done(response.url)
+
+    def item_dropped(self, item, response, exception, spider):
+        self.index.add_done(response.url)
@@ -0,0 +1,199 @@
+import logging
+import time
+from typing import Dict
+from typing import List
+from typing import Tuple
+
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+from scrapy.utils.reactor import listen_tcp
+from twisted.internet import task
+from twisted.web import resource
+from twisted.web import server
+
+from hardware_scraper.middlewares.parse_latency_middleware import (
+    PARSE_LATENCY_BUCKETS,
+)
+from hardware_scraper.signals import metrics_requested
+
+logger = logging.getLogger(__name__)
+
+PREFIX = "hardware_scraper"
+# counters taken from stats: metric name -> (stats key, help)
+COUNTERS = {
+    "requests_total": ("downloader/request_count", "Requests sent to downloader."),
+    "responses_total": ("downloader/response_count", "Downloaded responses."),
+    "items_total": ("item_scraped_count", "Scraped items."),
+    "httpcache_hits_total": ("httpcache/hit", "Responses taken from HTTP cache."),
+    "httpcache_misses_total": ("httpcache/miss", "Requests missed in HTTP cache."),
+    "too_many_requests_total": ("too_many_requests/count", "Responses with 429."),
+    "backoff_seconds_total": (
+        "too_many_requests/backoff_time",
+        "Seconds of backoff of download slots after 429.",
+    ),
+    "wrong_pages_total": ("wrong_page/count", "Retried wrong pages."),
+}
+# gauges taken from stats: metric name -> (stats key, help)
+GAUGES = {
+    "proxies_active": ("proxy/active", "Proxies which aren't cooling down."),
+    "proxies": ("proxy/count", "Proxies in the pool."),
+}
+# rates calculated over METRICS_INTERVAL: metric name -> (stats key, help)
+RATES = {
+    "requests_per_second": ("downloader/request_count", "Rate of requests."),
+    "items_per_second": ("item_scraped_count", "Rate of scraped items."),
+}
+
+
+def format_labels(labels: Dict[str, str]) -> str:
+    return ",".join(f'{key}="{value}"' for key, value in labels.items())
+
+
+def format_metric(
+    name: str, kind: str, help_text: str, samples: List[Tuple[str, Dict, float]]
+) -> List[str]:
+    """Format samples `(suffix, labels, value)` in Prometheus text format."""
+    lines = [f"# HELP {PREFIX}_{name} {help_text}", f"# TYPE {PREFIX}_{name} {kind}"]
+    for suffix, labels, value in samples:
+        lines.append(f"{PREFIX}_{name}{suffix}{{{format_labels(labels)}}} {value}")
+    return lines
+
+
+class MetricsResource(resource.Resource):
+    isLeaf = True
+
+    def __init__(self, exporter):
+        super().__init__()
+        self.exporter = exporter
+
+    def render_GET(self, request):
+        request.setHeader(b"Content-Type", b"text/plain; version=0.0.4; charset=utf-8")
+        return self.exporter.render().encode()
+
+
+class MetricsExporter:
+    """Serves metrics of the crawl in Prometheus text format.
+
+    Metrics are taken from stats and are available at
+    `http://METRICS_HOST:METRICS_PORT/metrics` while the spider is running.
+    Parse latency histograms are recorded by ParseLatencyMiddleware, gauges are
+    updated on `metrics_requested` signal sent before rendering.
+    """
+
+    def __init__(
+        self, stats, host: str, portrange: List[int], interval: float, signals=None
+    ):
+        self.stats = stats
+        self.signals = signals
+        self.host = host
+        self.portrange = portrange
+        self.interval = interval
+        self.spider = None
+        self.port = None
+        self.task = None
+        self.rates: Dict[str, float] = {}
+        self.previous: Dict[str, float] = {}
+        self.previous_time = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        if not settings.getbool("METRICS_ENABLED"):
+            raise NotConfigured
+
+        ext = cls(
+            stats=crawler.stats,
+            host=settings.get("METRICS_HOST"),
+            portrange=[int(x) for x in settings.getlist("METRICS_PORT")],
+            interval=settings.getfloat("METRICS_INTERVAL"),
+            signals=crawler.signals,
+        )
+        crawler.signals.connect(ext.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(ext.spider_closed, signal=signals.spider_closed)
+        return ext
+
+    def spider_opened(self, spider):
+        self.spider = spider
+        self.port = listen_tcp(
+            self.portrange, self.host, server.Site(MetricsResource(self))
+        )
+        address = self.port.getHost()
+        logger.info(
+            f"Metrics are served at http://{address.host}:{address.port}/metrics"
+        )
+        self.task = task.LoopingCall(self.update_rates)
+        self.task.start(self.interval)
+
+    def spider_closed(self, spider):
+        if self.task is not None and self.task.running:
+            self.task.stop()
+        if self.port is not None:
+            self.port.stopListening()
+
+    def _get_value(self, key: str) -> float:
+        return self.stats.get_value(key, 0, spider=self.spider)
+
+    def update_rates(self):
+        now = time.monotonic()
+        for name, (key, _) in RATES.items():
+            value = self._get_value(key)
+            if self.previous_time is not None:
+                elapsed = now - self.previous_time
+                self.rates[name] = (value - self.previous[name]) / elapsed
+            self.previous[name] = value
+        self.previous_time = now
+
+    def render(self) -> str:
+        if self.signals is not None:
+            self.signals.send_catch_log(metrics_requested, spider=self.spider)
+        labels = {"spider": self.spider.name}
+        lines = []
+        for name, (key, help_text) in COUNTERS.items():
+            lines += format_metric(
+                name, "counter", help_text, [("", labels, self._get_value(key))]
+            )
+        for name, (key, help_text) in GAUGES.items():
+            value = self.stats.get_value(key, spider=self.spider)
+            if value is not None:
+                lines += format_metric(name, "gauge", help_text, [("", labels, value)])
+        for name, (_, help_text) in RATES.items():
+            value = self.rates.get(name, 0.0)
+            lines += format_metric(name, "gauge", help_text, [("", labels, value)])
+
+        hits = self._get_value("httpcache/hit")
+        lookups = hits + self._get_value("httpcache/miss")
+        ratio = hits / lookups if lookups else 0.0
+        lines += format_metric(
+            "httpcache_hit_ratio",
+            "gauge",
+            "Share of requests taken from HTTP cache.",
+            [("", labels, ratio)],
+        )
+
+        lines += format_metric(
+            "parse_latency_seconds",
+            "histogram",
+            "Time spent in spider callbacks.",
+            self._get_histogram_samples(labels),
+        )
+        return "\n".join(lines) + "\n"
+
+    def _get_histogram_samples(self, labels) -> List[Tuple[str, Dict, float]]:
+        stats = self.stats.get_stats(spider=self.spider)
+        callbacks = sorted(
+            key.split("/")[1]
+            for key in stats
+            if key.startswith("parse_latency/") and key.endswith("/count")
+        )
+        samples = []
+        for callback in callbacks:
+            prefix = f"parse_latency/{callback}"
+            callback_labels = {**labels, "callback": callback}
+            # buckets of Prometheus histograms are cumulative
+            count = 0
+            for bound in [*map(str, PARSE_LATENCY_BUCKETS), "+Inf"]:
+                count += stats.get(f"{prefix}/{bound}", 0)
+                samples.append(("_bucket", {**callback_labels, "le": bound}, count))
+            samples.append(("_sum", callback_labels, stats.get(f"{prefix}/sum", 0)))
+            samples.append(("_count", callback_labels, stats.get(f"{prefix}/count")))
+        return samples
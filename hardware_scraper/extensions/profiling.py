@@ -0,0 +1,148 @@
+import datetime
+import logging
+import pathlib
+import time
+from typing import Dict
+from typing import Tuple
+
+from itemloaders.common import wrap_loader_context
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+from scrapy.loader import ItemLoader
+
+from hardware_scraper.extensions.utils import save_json
+
+logger = logging.getLogger(__name__)
+
+
+class ProcessorStats:
+    __slots__ = ("calls", "seconds", "errors", "values")
+
+    def __init__(self):
+        self.calls = 0
+        self.seconds = 0.0
+        self.errors = 0
+        # hashes of distinct values given to the processor
+        self.values = set()
+
+    def to_dict(self) -> Dict:
+        return {
+            "calls": self.calls,
+            "seconds": self.seconds,
+            "us_per_call": self.seconds / self.calls * 1e6 if self.calls else 0.0,
+            "errors": self.errors,
+            "distinct_values": len(self.values),
+        }
+
+
+class ProfiledProcessor:
+    def __init__(self, processor, stats: ProcessorStats):
+        self.processor = processor
+        self.stats = stats
+
+    def __call__(self, value):
+        stats = self.stats
+        stats.calls += 1
+        stats.values.add(hash(repr(value)))
+        start = time.perf_counter()
+        try:
+            return self.processor(value)
+        except Exception:
+            stats.errors += 1
+            raise
+        finally:
+            stats.seconds += time.perf_counter() - start
+
+
+class ProcessorProfile:
+    """Statistics of input and output processors of item fields."""
+
+    def __init__(self):
+        self.processors: Dict[Tuple[str, str], ProcessorStats] = {}
+
+    def get(self, field: str, kind: str) -> ProcessorStats:
+        stats = self.processors.get((field, kind))
+        if stats is None:
+            stats = self.processors[field, kind] = ProcessorStats()
+        return stats
+
+    def to_dict(self) -> Dict[str, Dict]:
+        # the slowest processors go first
+        processors = sorted(
+            self.processors.items(), key=lambda x: x[1].seconds, reverse=True
+        )
+        return {
+            f"{field}/{kind}": stats.to_dict() for (field, kind), stats in processors
+        }
+
+
+class ProfilingItemLoader(ItemLoader):
+    """Item loader that records statistics of processors into `profile`."""
+
+    profile: ProcessorProfile = None
+
+    def get_input_processor(self, field_name):
+        processor = super().get_input_processor(field_name)
+        return ProfiledProcessor(
+            wrap_loader_context(processor, self.context),
+            self.profile.get(field_name, "input"),
+        )
+
+    def get_output_processor(self, field_name):
+        processor = super().get_output_processor(field_name)
+        return ProfiledProcessor(
+            wrap_loader_context(processor, self.context),
+            self.profile.get(field_name, "output"),
+        )
+
+
+class ProcessorProfiling:
+    """Profiles input and output processors of item fields.
+
+    Item loaders of spiders are replaced by `ProfilingItemLoader`, calls, time,
+    errors and distinct values of every processor are written to stats and
+    a report `PROCESSOR_PROFILING_DIR/<spider>_<time>.json` on spider close.
+    """
+
+    def __init__(self, directory: pathlib.Path, stats):
+        self.directory = directory
+        self.stats = stats
+        self.profile = ProcessorProfile()
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        if not settings.getbool("PROCESSOR_PROFILING_ENABLED"):
+            raise NotConfigured
+
+        ext = cls(
+            directory=pathlib.Path(settings.get("PROCESSOR_PROFILING_DIR")),
+            stats=crawler.stats,
+        )
+        crawler.signals.connect(ext.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(ext.spider_closed, signal=signals.spider_closed)
+        return ext
+
+    def spider_opened(self, spider):
+        spider.loader_cls = type(
+            "ProfilingItemLoader",
+            (ProfilingItemLoader, spider.loader_cls),
+            {"profile": self.profile},
+        )
+
+    def spider_closed(self, spider):
+        report = self.profile.to_dict()
+        for name, processor_stats in report.items():
+            for key in ("calls", "seconds", "errors", "distinct_values"):
+                self.stats.set_value(
+                    f"processor_profiling/{name}/{key}",
+                    processor_stats[key],
+                    spider=spider,
+                )
+
+        timestamp = datetime.datetime.utcnow().replace(microsecond=0).isoformat()
+        path = self.directory.joinpath(
+            f"{spider.name}_{timestamp.replace(':', '-')}.json"
+        )
+        save_json(path, report)
+        logger.info(f"Profile of processors is written into: {path}")
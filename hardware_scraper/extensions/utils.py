@@ -0,0 +1,19 @@
+import json
+import pathlib
+from typing import Any
+
+
+def load_json(path: pathlib.Path, default: Any = None) -> Any:
+    if not path.exists():
+        return default
+    with path.open() as f:
+        return json.load(f)
+
+
+def save_json(path: pathlib.Path, data: Any):
+    # write to temporary file first to not to lose the data on interruption
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".tmp")
+    with tmp_path.open("w") as f:
+        json.dump(data, f)
+    tmp_path.replace(path)
@@ -0,0 +1,207 @@
+import gzip
+import logging
+import os
+import pickle
+import sqlite3
+import zlib
+from time import time
+
+from scrapy.extensions.httpcache import DummyPolicy
+from scrapy.http import Headers
+from scrapy.responsetypes import responsetypes
+from scrapy.utils.project import data_path
+from scrapy.utils.request import request_fingerprint
+from w3lib.http import headers_dict_to_raw
+from w3lib.http import headers_raw_to_dict
+
+logger = logging.getLogger(__name__)
+
+DB_FILENAME = "httpcache.sqlite"
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS responses (
+    spider TEXT NOT NULL,
+    fingerprint TEXT NOT NULL,
+    url TEXT NOT NULL,
+    method TEXT NOT NULL,
+    status INTEGER NOT NULL,
+    response_url TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    size INTEGER NOT NULL,
+    headers BLOB NOT NULL,
+    body BLOB NOT NULL,
+    PRIMARY KEY (spider, fingerprint)
+) WITHOUT ROWID
+"""
+INSERT_QUERY = """
+INSERT OR REPLACE INTO responses (
+    spider, fingerprint, url, method, status, response_url, timestamp, size, headers, body
+) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
+
+
+def connect(path):
+    connection = sqlite3.connect(path)
+    connection.execute("PRAGMA journal_mode=WAL")
+    connection.execute("PRAGMA synchronous=NORMAL")
+    connection.execute(SCHEMA)
+    return connection
+
+
+class RefreshCachePolicy(DummyPolicy):
+    """Like DummyPolicy, but requests with `refresh_cache` meta bypass the cache.
+
+    Their responses are downloaded again and replace the cached ones.
+    """
+
+    def is_request_fresh(self, request) -> bool:
+        """Check that the cached response of the request can be used."""
+        return not request.meta.get("refresh_cache", False)
+
+    def is_cached_response_fresh(self, cachedresponse, request):
+        return self.is_request_fresh(request)
+
+    def is_cached_response_valid(self, cachedresponse, response, request):
+        return not request.meta.get("refresh_cache", False)
+
+
+class SqliteCacheStorage:
+    """HTTP cache storage keeping all responses in a single SQLite database.
+
+    Bodies are compressed with zlib, there is one row per response instead of
+    a directory with six files in FilesystemCacheStorage.
+    """
+
+    def __init__(self, settings):
+        self.cachedir = data_path(settings["HTTPCACHE_DIR"], createdir=True)
+        self.expiration_secs = settings.getint("HTTPCACHE_EXPIRATION_SECS")
+        self.compression_level = settings.getint("HTTPCACHE_SQLITE_COMPRESSION_LEVEL")
+        self.db = None
+
+    def open_spider(self, spider):
+        dbpath = os.path.join(self.cachedir, DB_FILENAME)
+        self.db = connect(dbpath)
+
+        logger.debug(
+            "Using SQLite cache storage in %(cachepath)s",
+            {"cachepath": dbpath},
+            extra={"spider": spider},
+        )
+
+    def close_spider(self, spider):
+        self.db.close()
+
+    def has_response(self, spider, request) -> bool:
+        """Check that the response is cached without reading it."""
+        row = self.db.execute(
+            "SELECT timestamp FROM responses WHERE spider = ? AND fingerprint = ?",
+            (spider.name, request_fingerprint(request)),
+        ).fetchone()
+        return row is not None and not 0 < self.expiration_secs < time() - row[0]
+
+    def retrieve_response(self, spider, request):
+        row = self.db.execute(
+            "SELECT response_url, status, timestamp, headers, body FROM responses "
+            "WHERE spider = ? AND fingerprint = ?",
+            (spider.name, request_fingerprint(request)),
+        ).fetchone()
+        if row is None:
+            return  # not cached
+
+        url, status, timestamp, rawheaders, body = row
+        if 0 < self.expiration_secs < time() - timestamp:
+            return  # expired
+
+        headers = Headers(headers_raw_to_dict(rawheaders))
+        body = zlib.decompress(body)
+        respcls = responsetypes.from_args(headers=headers, url=url)
+        response = respcls(url=url, headers=headers, status=status, body=body)
+        return response
+
+    def store_response(self, spider, request, response):
+        with self.db:
+            self.db.execute(
+                INSERT_QUERY,
+                (
+                    spider.name,
+                    request_fingerprint(request),
+                    request.url,
+                    request.method,
+                    response.status,
+                    response.url,
+                    time(),
+                    len(response.body),
+                    headers_dict_to_raw(response.headers),
+                    zlib.compress(response.body, self.compression_level),
+                ),
+            )
+
+
+def iter_filesystem_cache(cachedir):
+    """Iterate over (spider name, fingerprint, path) of FilesystemCacheStorage."""
+    for spider_name in sorted(os.listdir(cachedir)):
+        spider_dir = os.path.join(cachedir, spider_name)
+        if not os.path.isdir(spider_dir):
+            continue
+        for prefix in sorted(os.listdir(spider_dir)):
+            prefix_dir = os.path.join(spider_dir, prefix)
+            for fingerprint in sorted(os.listdir(prefix_dir)):
+                yield spider_name, fingerprint, os.path.join(prefix_dir, fingerprint)
+
+
+def _read_filesystem_entry(rpath, open_file):
+    with open_file(os.path.join(rpath, "pickled_meta"), "rb") as f:
+        metadata = pickle.load(f)
+    with open_file(os.path.join(rpath, "response_headers"), "rb") as f:
+        rawheaders = f.read()
+    with open_file(os.path.join(rpath, "response_body"), "rb") as f:
+        body = f.read()
+    # expiration is checked by mtime in FilesystemCacheStorage
+    timestamp = os.stat(os.path.join(rpath, "pickled_meta")).st_mtime
+    return metadata, timestamp, rawheaders, body
+
+
+def import_filesystem_cache(
+    cachedir, dbpath, compression_level=6, gzipped=False, batch_size=1000
+):
+    """Import cache of FilesystemCacheStorage into SQLite database.
+
+    Returns the number of imported responses.
+    """
+    open_file = gzip.open if gzipped else open
+    db = connect(dbpath)
+    count = 0
+    rows = []
+    try:
+        for spider_name, fingerprint, rpath in iter_filesystem_cache(cachedir):
+            try:
+                metadata, timestamp, rawheaders, body = _read_filesystem_entry(
+                    rpath, open_file
+                )
+            except FileNotFoundError:
+                logger.warning(f"Skipping incomplete cache entry: {rpath}")
+                continue
+            rows.append(
+                (
+                    spider_name,
+                    fingerprint,
+                    metadata["url"],
+                    metadata["method"],
+                    metadata["status"],
+                    metadata.get("response_url", metadata["url"]),
+                    timestamp,
+                    len(body),
+                    rawheaders,
+                    zlib.compress(body, compression_level),
+                )
+            )
+            if len(rows) >= batch_size:
+                with db:
+                    db.executemany(INSERT_QUERY, rows)
+                count += len(rows)
+                rows = []
+        with db:
+            db.executemany(INSERT_QUERY, rows)
+        count += len(rows)
+    finally:
+        db.close()
+    return count
@@ -3,10 +3,17 @@
 # See documentation in:
 # https://docs.scrapy.org/en/latest/topics/items.html
 
+import calendar
+import datetime
 import re
+from functools import lru_cache
+from html.entities import html5
 from typing import Any
 from typing import Dict
+from typing import NamedTuple
 from typing import Optional
+from typing import Pattern
+from typing import Tuple
 
 import scrapy
 from bs4 import BeautifulSoup
@@ -15,10 +22,81 @@ from itemloaders.processors import MapCompose
 from itemloaders.processors import TakeFirst
 from scrapy import Field
 
+# markup that doesn't produce any text: script/style blocks, comments, tags,
+# declarations and processing instructions, quoted attribute values can
+# contain ">", malformed markup is left in text
+TAGS_PATTERN = re.compile(
+    r"<script\b.*?</script\s*>"
+    r"|<style\b.*?</style\s*>"
+    r"|<!--.*?-->"
+    r"|<[A-Za-z][^<>\"']*(?:(?:\"[^\"]*\"|'[^']*')[^<>\"']*)*>"
+    r"|</[A-Za-z][^<>]*>"
+    r"|<![A-Za-z][^<>]*>"
+    r"|<\?[^<>]*>",
+    re.DOTALL | re.IGNORECASE,
+)
+# markup with special handling of text: preserved whitespace and CDATA
+SPECIAL_TEXT_PATTERN = re.compile(r"<(?:pre|textarea|!\[)", re.IGNORECASE)
+# references terminated by semicolons, others are left to BeautifulSoup
+REFERENCE_PATTERN = re.compile(
+    r"&(?:#([0-9]{1,7})|#[xX]([0-9a-fA-F]{1,6})|([a-zA-Z][a-zA-Z0-9]*));"
+)
+ASCII_SPACES = " \n\t\x0c\r"
+
+
+def _collapse_whitespace(data: str) -> str:
+    # whitespace-only strings are collapsed the same way as BeautifulSoup does it
+    if not data or data.strip(ASCII_SPACES):
+        return data
+    return "\n" if "\n" in data else " "
+
+
+def _get_reference_character(
+    decimal: Optional[str], hexadecimal: Optional[str], name: Optional[str]
+) -> Optional[str]:
+    if name is not None:
+        return html5.get(f"{name};")
+    codepoint = int(decimal) if decimal is not None else int(hexadecimal, 16)
+    # control characters are decoded as windows-1252 by BeautifulSoup,
+    # surrogates and out of range values are replaced
+    valid = 0 < codepoint < 0x80 or 0xA0 <= codepoint < 0xD800
+    if valid or 0xE000 <= codepoint <= 0x10FFFF:
+        return chr(codepoint)
+    return None
+
+
+def _unescape(data: str) -> Optional[str]:
+    """Replace character references, None if some of them aren't simple."""
+    if "&" not in data:
+        return data
+    chunks = []
+    position = 0
+    for match in REFERENCE_PATTERN.finditer(data):
+        character = _get_reference_character(*match.groups())
+        if character is None or "&" in data[position : match.start()]:
+            return None
+        chunks += [data[position : match.start()], character]
+        position = match.end()
+    if "&" in data[position:]:
+        return None
+    chunks.append(data[position:])
+    return "".join(chunks)
+
 
 def extract_text_from_tags(value: str) -> str:
-    soup = BeautifulSoup(value, "html.parser")
-    return soup.text
+    """Strip tags from html fragment.
+
+    Gives the same result as `BeautifulSoup(value, "html.parser").get_text()`,
+    common fragments are handled without building a parse tree.
+    """
+    if "<" not in value and "&" not in value:
+        return _collapse_whitespace(value)
+    if SPECIAL_TEXT_PATTERN.search(value) is None:
+        texts = [_unescape(data) for data in TAGS_PATTERN.split(value)]
+        # malformed markup is left in text
+        if None not in texts and not any("<" in text for text in texts):
+            return "".join(_collapse_whitespace(text) for text in texts)
+    return BeautifulSoup(value, "html.parser").get_text()
 
 
 def extract_by_regexp(pattern: str, special_values: Optional[Dict[str, Any]] = None):
@@ -39,99 +117,118 @@ def extract_by_regexp(pattern: str, special_values: Optional[Dict[str, Any]] = N
     return wrapped
 
 
-def extract_unit_value(
-    pattern: str, value_name: str, unit_factors: Dict[str, float], value: str
-):
-    matches = re.findall(pattern, value)
-    if len(matches) > 1:
+class UnitGrammar(NamedTuple):
+    value_name: str
+    pattern: Pattern
+    unit_factors: Dict[str, float]
+    special_values: Dict[str, Any]
+
+
+def _unit_grammar(
+    value_name: str,
+    pattern: str,
+    unit_factors: Dict[str, float],
+    special_values: Optional[Dict[str, Any]] = None,
+) -> UnitGrammar:
+    special_values = {"N/A": None, **(special_values or {})}
+    return UnitGrammar(value_name, re.compile(pattern), unit_factors, special_values)
+
+
+UNIT_GRAMMARS = {
+    "frequency": _unit_grammar(
+        "frequency",
+        r"((?:\d*[.])?\d+)\s*(MHz|GHz)",
+        {"GHz": 1000, "MHz": 1},
+        special_values={"System Shared": None},
+    ),
+    "pixel_rate": _unit_grammar(
+        "pixel rate",
+        r"((?:\d*[.])?\d+)\s*(MPixel/s|GPixel/s)",
+        {"GPixel/s": 1000, "MPixel/s": 1},
+    ),
+    "texture_rate": _unit_grammar(
+        "texture rate",
+        r"((?:\d*[.])?\d+)\s*(MTexel/s|GTexel/s)",
+        {"GTexel/s": 1000, "MTexel/s": 1},
+    ),
+    "flops": _unit_grammar(
+        "flops",
+        r"((?:\d*[.])?\d+)\s*(GFLOPS|TFLOPS)",
+        {"TFLOPS": 1000, "GFLOPS": 1},
+    ),
+    "cache_size": _unit_grammar(
+        "cache size",
+        r"((?:\d*[.])?\d+)\s?(KB|MB)",
+        {"MB": 1000, "KB": 1},
+    ),
+    "memory_size": _unit_grammar(
+        "memory size",
+        r"((?:\d*[.])?\d+)\s?(MB|GB)",
+        {"GB": 1000, "MB": 1},
+        special_values={"System Shared": None},
+    ),
+    "memory_bandwidth": _unit_grammar(
+        "memory bandwidth",
+        r"((?:\d*[.])?\d+)\s?(MB/s|GB/s)",
+        {"MB/s": 1 / 1000, "GB/s": 1},
+        special_values={"System Dependent": None},
+    ),
+}
+
+
+@lru_cache(maxsize=8192)
+def parse_quantity(kind: str, value: str) -> Optional[float]:
+    """Parse value of the given kind from `UNIT_GRAMMARS` into its base unit.
+
+    Results are cached on raw text, because the same values repeat across items.
+    """
+    grammar = UNIT_GRAMMARS[kind]
+    if value in grammar.special_values:
+        return grammar.special_values[value]
+
+    matches = grammar.pattern.finditer(value)
+    match = next(matches, None)
+    if match is None:
+        raise ValueError(f"Unknown {grammar.value_name}: {value}")
+    if next(matches, None) is not None:
         raise ValueError(
-            f"There should be exactly one {value_name} in match by pattern: {pattern}"
+            f"There should be exactly one {grammar.value_name} in match by pattern: "
+            f"{grammar.pattern.pattern}"
         )
-    if len(matches) == 0:
-        if value == "N/A":
-            return None
-        else:
-            raise ValueError(f"Unknown {value_name}: {value}")
 
-    value, unit = matches[0]
-    value = float(value)
-    factor = unit_factors.get(unit, None)
+    number, unit = match.groups()
+    factor = grammar.unit_factors.get(unit, None)
     if factor is None:
-        raise ValueError(f"Unknown unit of {value_name}: {unit}")
-    value *= factor
-    return value
+        raise ValueError(f"Unknown unit of {grammar.value_name}: {unit}")
+    return float(number) * factor
 
 
 def extract_frequency(value: str) -> Optional[float]:
-    if value == "System Shared":
-        return None
-
-    pattern = r"((?:\d*[.])?\d+)\s*(MHz|GHz)"
-    value_name = "frequency"
-    unit_factors = {"GHz": 1000, "MHz": 1}
-    return extract_unit_value(
-        pattern=pattern, value_name=value_name, unit_factors=unit_factors, value=value
-    )
+    return parse_quantity("frequency", value)
 
 
 def extract_pixel_rate(value: str) -> Optional[float]:
-    pattern = r"((?:\d*[.])?\d+)\s*(MPixel/s|GPixel/s)"
-    value_name = "pixel rate"
-    unit_factors = {"GPixel/s": 1000, "MPixel/s": 1}
-    return extract_unit_value(
-        pattern=pattern, value_name=value_name, unit_factors=unit_factors, value=value
-    )
+    return parse_quantity("pixel_rate", value)
 
 
 def extract_texture_rate(value: str) -> Optional[float]:
-    pattern = r"((?:\d*[.])?\d+)\s*(MTexel/s|GTexel/s)"
-    value_name = "texture rate"
-    unit_factors = {"GTexel/s": 1000, "MTexel/s": 1}
-    return extract_unit_value(
-        pattern=pattern, value_name=value_name, unit_factors=unit_factors, value=value
-    )
+    return parse_quantity("texture_rate", value)
 
 
 def extract_flops(value: str) -> Optional[float]:
-    pattern = r"((?:\d*[.])?\d+)\s*(GFLOPS|TFLOPS)"
-    value_name = "flops"
-    unit_factors = {"TFLOPS": 1000, "GFLOPS": 1}
-    return extract_unit_value(
-        pattern=pattern, value_name=value_name, unit_factors=unit_factors, value=value
-    )
+    return parse_quantity("flops", value)
 
 
 def extract_cache_size(value: str) -> Optional[float]:
-    pattern = r"((?:\d*[.])?\d+)\s?(KB|MB)"
-    value_name = "cache size"
-    unit_factors = {"MB": 1000, "KB": 1}
-    return extract_unit_value(
-        pattern=pattern, value_name=value_name, unit_factors=unit_factors, value=value
-    )
+    return parse_quantity("cache_size", value)
 
 
 def extract_memory_size(value: str) -> Optional[float]:
-    if value == "System Shared":
-        return None
-
-    pattern = r"((?:\d*[.])?\d+)\s?(MB|GB)"
-    value_name = "memory size"
-    unit_factors = {"GB": 1000, "MB": 1}
-    return extract_unit_value(
-        pattern=pattern, value_name=value_name, unit_factors=unit_factors, value=value
-    )
+    return parse_quantity("memory_size", value)
 
 
 def extract_memory_bandwidth(value: str) -> Optional[float]:
-    if value == "System Dependent":
-        return None
-
-    pattern = r"((?:\d*[.])?\d+)\s?(MB/s|GB/s)"
-    value_name = "memory bandwidth"
-    unit_factors = {"MB/s": 1 / 1000, "GB/s": 1}
-    return extract_unit_value(
-        pattern=pattern, value_name=value_name, unit_factors=unit_factors, value=value
-    )
+    return parse_quantity("memory_bandwidth", value)
 
 
 def extract_cache_type(value: str) -> Optional[str]:
@@ -157,21 +254,113 @@ def extract_multiplier(value: str) -> bool:
         raise ValueError(f"Unknown value for multiplier: {value}")
 
 
-def extract_release_date(value: str) -> Optional[str]:
+MONTHS = {
+    name.lower(): number
+    for number in range(1, 13)
+    for name in (calendar.month_name[number], calendar.month_abbr[number])
+}
+MONTHS["sept"] = 9
+# formats used on TechPowerUp: "Jan 7th, 2019", "Jan 2019" and "2019"
+RELEASE_DATE_PATTERN = re.compile(
+    r"(?:([A-Za-z]+)\.?\s+(?:(\d{1,2})(?:st|nd|rd|th)?,?\s+)?)?(\d{4})"
+)
+
+
+@lru_cache(maxsize=4096)
+def parse_release_date_parts(
+    value: str,
+) -> Optional[Tuple[int, Optional[int], Optional[int]]]:
+    """Get year, month and day of known formats, missing parts are None."""
+    match = RELEASE_DATE_PATTERN.fullmatch(value)
+    if match is None:
+        return None
+
+    month_name, day, year = match.groups()
+    month = None
+    if month_name is not None:
+        month = MONTHS.get(month_name.lower())
+        if month is None:
+            return None
+    return int(year), month, None if day is None else int(day)
+
+
+def parse_known_release_date(value: str) -> Optional[datetime.date]:
+    parts = parse_release_date_parts(value)
+    if parts is None:
+        return None
+
+    year, month, day = parts
+    # missing parts are taken from today like in `dateutil.parser.parse`,
+    # so they aren't cached
+    today = datetime.date.today()
+    if month is None:
+        month = today.month
+    if day is None:
+        day = min(today.day, calendar.monthrange(year, month)[1])
+    try:
+        return datetime.date(year, month, day)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=1024)
+def parse_release_date_on(value: str, today: datetime.date) -> datetime.date:
+    # today is a part of the key, `dateutil` takes missing parts from it
+    default = datetime.datetime.combine(today, datetime.time())
+    return parser.parse(value, default=default).date()
+
+
+def parse_release_date(value: str) -> datetime.date:
+    return parse_release_date_on(value, datetime.date.today())
+
+
+def normalize_release_date(value: str) -> Tuple[str, str]:
+    """Convert release date into iso format, returns it with the path taken.
+
+    Known formats are parsed directly (`fast_path`), `dateutil` is used only as
+    a `fallback`, results of both are cached, but parts missing in the value
+    are still taken from the current day.
+    """
+    date = parse_known_release_date(value)
+    if date is not None:
+        return date.isoformat(), "fast_path"
+    return parse_release_date(value).isoformat(), "fallback"
+
+
+def record_release_date_path(loader_context: Optional[Dict], path: str):
+    """Count paths of release date parsing in stats `release_date/<path>`."""
+    spider = (loader_context or {}).get("spider")
+    # spiders of reparse and benchmark_parsers commands aren't bound to crawlers
+    crawler = getattr(spider, "crawler", None)
+    if crawler is None:
+        return
+    crawler.stats.inc_value(f"release_date/{path}", spider=spider)
+
+
+def extract_release_date(
+    value: str, loader_context: Optional[Dict] = None
+) -> Optional[str]:
     if value == "Unknown" or value == "Never Released":
         return value
-    else:
-        return parser.parse(value).date().isoformat()
+    date, path = normalize_release_date(value)
+    record_release_date_path(loader_context, path)
+    return date
 
 
 def extract_generation(value: str) -> str:
-    soup = BeautifulSoup(value, "html.parser")
-    text = soup.text.strip()
+    text = extract_text_from_tags(value).strip()
     value_1, value_2 = text.split("\n", 1)
     return value_1
 
 
+# `dtype` (str if not set) and `unit` of fields describe values returned by
+# the processors, they are used as a schema of columnar exports. `key_field` of
+# item classes identifies products (see ChangeDetectionPipeline, SqliteItemSink)
+
+
 class CPUItem(scrapy.Item):
+    key_field = "cpu_full_name"
+
     # Physical section
     cpu_full_name = Field(
         input_processor=MapCompose(str.strip), output_processor=TakeFirst()
@@ -189,6 +378,8 @@ class CPUItem(scrapy.Item):
     )
     # in nm
     process_size = Field(
+        dtype=int,
+        unit="nm",
         input_processor=MapCompose(
             extract_text_from_tags,
             str.strip,
@@ -199,6 +390,8 @@ class CPUItem(scrapy.Item):
     )
     # in mm^2
     die_size = Field(
+        dtype=float,
+        unit="mm²",
         input_processor=MapCompose(
             extract_text_from_tags,
             str.strip,
@@ -211,6 +404,8 @@ class CPUItem(scrapy.Item):
     # Performance section
     # in MHz
     frequency = Field(
+        dtype=float,
+        unit="MHz",
         input_processor=MapCompose(
             extract_text_from_tags, str.strip, extract_frequency
         ),
@@ -218,12 +413,15 @@ class CPUItem(scrapy.Item):
     )
     # in MHz
     turbo_frequency = Field(
+        dtype=float,
+        unit="MHz",
         input_processor=MapCompose(
             extract_text_from_tags, str.strip, extract_frequency
         ),
         output_processor=TakeFirst(),
     )
     unlocked_multiplier = Field(
+        dtype=bool,
         input_processor=MapCompose(
             extract_text_from_tags, str.strip, extract_multiplier
         ),
@@ -231,6 +429,8 @@ class CPUItem(scrapy.Item):
     )
     # in Wats
     tdp = Field(
+        dtype=float,
+        unit="W",
         input_processor=MapCompose(
             extract_text_from_tags, str.strip, extract_by_regexp(r"(\d+)\s*W"), float
         ),
@@ -263,10 +463,12 @@ class CPUItem(scrapy.Item):
 
     # Cores section
     number_of_cores = Field(
+        dtype=int,
         input_processor=MapCompose(extract_text_from_tags, str.strip, int),
         output_processor=TakeFirst(),
     )
     number_of_threads = Field(
+        dtype=int,
         input_processor=MapCompose(extract_text_from_tags, str.strip, int),
         output_processor=TakeFirst(),
     )
@@ -277,6 +479,8 @@ class CPUItem(scrapy.Item):
 
     # Cache section
     cache_l1 = Field(
+        dtype=float,
+        unit="KB",
         input_processor=MapCompose(
             extract_text_from_tags, str.strip, extract_cache_size
         ),
@@ -289,6 +493,8 @@ class CPUItem(scrapy.Item):
         output_processor=TakeFirst(),
     )
     cache_l2 = Field(
+        dtype=float,
+        unit="KB",
         input_processor=MapCompose(
             extract_text_from_tags, str.strip, extract_cache_size
         ),
@@ -301,6 +507,8 @@ class CPUItem(scrapy.Item):
         output_processor=TakeFirst(),
     )
     cache_l3 = Field(
+        dtype=float,
+        unit="KB",
         input_processor=MapCompose(
             extract_text_from_tags, str.strip, extract_cache_size
         ),
@@ -315,6 +523,7 @@ class CPUItem(scrapy.Item):
 
     # Features section
     features = Field(
+        dtype=list,
         input_processor=MapCompose(extract_text_from_tags, str.strip),
     )
 
@@ -326,6 +535,8 @@ class CPUItem(scrapy.Item):
 
 
 class GPUItem(scrapy.Item):
+    key_field = "gpu_full_name"
+
     # Graphics Processor section
     gpu_full_name = Field(
         input_processor=MapCompose(str.strip), output_processor=TakeFirst()
@@ -350,6 +561,8 @@ class GPUItem(scrapy.Item):
     )
     # in nm
     process_size = Field(
+        dtype=int,
+        unit="nm",
         input_processor=MapCompose(
             extract_text_from_tags,
             str.strip,
@@ -360,6 +573,8 @@ class GPUItem(scrapy.Item):
     )
     # in mm^2
     die_size = Field(
+        dtype=float,
+        unit="mm²",
         input_processor=MapCompose(
             extract_text_from_tags,
             str.strip,
@@ -390,6 +605,8 @@ class GPUItem(scrapy.Item):
     # Clock Speeds section
     # in MHz
     frequency = Field(
+        dtype=float,
+        unit="MHz",
         input_processor=MapCompose(
             extract_text_from_tags, str.strip, extract_frequency
         ),
@@ -397,6 +614,8 @@ class GPUItem(scrapy.Item):
     )
     # in MHz
     turbo_frequency = Field(
+        dtype=float,
+        unit="MHz",
         input_processor=MapCompose(
             extract_text_from_tags, str.strip, extract_frequency
         ),
@@ -404,6 +623,8 @@ class GPUItem(scrapy.Item):
     )
     # in MHz
     memory_frequency = Field(
+        dtype=float,
+        unit="MHz",
         input_processor=MapCompose(
             extract_text_from_tags, str.strip, extract_frequency
         ),
@@ -413,6 +634,8 @@ class GPUItem(scrapy.Item):
     # Theoretical Performance section
     # in MPixes/s
     pixel_rate = Field(
+        dtype=float,
+        unit="MPixel/s",
         input_processor=MapCompose(
             extract_text_from_tags, str.strip, extract_pixel_rate
         ),
@@ -420,6 +643,8 @@ class GPUItem(scrapy.Item):
     )
     # in MTexel/s
     texture_rate = Field(
+        dtype=float,
+        unit="MTexel/s",
         input_processor=MapCompose(
             extract_text_from_tags, str.strip, extract_texture_rate
         ),
@@ -427,16 +652,22 @@ class GPUItem(scrapy.Item):
     )
     # in GFlops
     fp_16 = Field(
+        dtype=float,
+        unit="GFLOPS",
         input_processor=MapCompose(extract_text_from_tags, str.strip, extract_flops),
         output_processor=TakeFirst(),
     )
     # in GFlops
     fp_32 = Field(
+        dtype=float,
+        unit="GFLOPS",
         input_processor=MapCompose(extract_text_from_tags, str.strip, extract_flops),
         output_processor=TakeFirst(),
     )
     # in GFlops
     fp_64 = Field(
+        dtype=float,
+        unit="GFLOPS",
         input_processor=MapCompose(extract_text_from_tags, str.strip, extract_flops),
         output_processor=TakeFirst(),
     )
@@ -444,6 +675,8 @@ class GPUItem(scrapy.Item):
     # Board Design section
     # in Wats
     tdp = Field(
+        dtype=float,
+        unit="W",
         input_processor=MapCompose(
             extract_text_from_tags,
             str.strip,
@@ -456,6 +689,8 @@ class GPUItem(scrapy.Item):
     # Memory section
     # in MB
     memory_size = Field(
+        dtype=float,
+        unit="MB",
         input_processor=MapCompose(
             extract_text_from_tags, str.strip, extract_memory_size
         ),
@@ -471,6 +706,8 @@ class GPUItem(scrapy.Item):
     )
     # in bits
     memory_bus = Field(
+        dtype=int,
+        unit="bit",
         input_processor=MapCompose(
             extract_text_from_tags,
             str.strip,
@@ -481,6 +718,8 @@ class GPUItem(scrapy.Item):
     )
     # in GB/s
     memory_bandwidth = Field(
+        dtype=float,
+        unit="GB/s",
         input_processor=MapCompose(
             extract_text_from_tags, str.strip, extract_memory_bandwidth
         ),
@@ -515,60 +754,77 @@ class GPUItem(scrapy.Item):
 
     # Render Config section
     shader_units = Field(
+        dtype=int,
         input_processor=MapCompose(extract_text_from_tags, str.strip, int),
         output_processor=TakeFirst(),
     )
     tmus = Field(
+        dtype=int,
         input_processor=MapCompose(extract_text_from_tags, str.strip, int),
         output_processor=TakeFirst(),
     )
     rops = Field(
+        dtype=int,
         input_processor=MapCompose(extract_text_from_tags, str.strip, int),
         output_processor=TakeFirst(),
     )
     sm_count = Field(
+        dtype=int,
         input_processor=MapCompose(extract_text_from_tags, str.strip, int),
         output_processor=TakeFirst(),
     )
     smm_count = Field(
+        dtype=int,
         input_processor=MapCompose(extract_text_from_tags, str.strip, int),
         output_processor=TakeFirst(),
     )
     compute_units = Field(
+        dtype=int,
         input_processor=MapCompose(extract_text_from_tags, str.strip, int),
         output_processor=TakeFirst(),
     )
     execution_units = Field(
+        dtype=int,
         input_processor=MapCompose(extract_text_from_tags, str.strip, int),
         output_processor=TakeFirst(),
     )
     tensor_cores = Field(
+        dtype=int,
         input_processor=MapCompose(extract_text_from_tags, str.strip, int),
         output_processor=TakeFirst(),
     )
     rt_cores = Field(
+        dtype=int,
         input_processor=MapCompose(extract_text_from_tags, str.strip, int),
         output_processor=TakeFirst(),
     )
     cache_l0 = Field(
+        dtype=float,
+        unit="KB",
         input_processor=MapCompose(
             extract_text_from_tags, str.strip, extract_cache_size
         ),
         output_processor=TakeFirst(),
     )
     cache_l1 = Field(
+        dtype=float,
+        unit="KB",
         input_processor=MapCompose(
             extract_text_from_tags, str.strip, extract_cache_size
         ),
         output_processor=TakeFirst(),
     )
     cache_l2 = Field(
+        dtype=float,
+        unit="KB",
         input_processor=MapCompose(
             extract_text_from_tags, str.strip, extract_cache_size
         ),
         output_processor=TakeFirst(),
     )
     cache_l3 = Field(
+        dtype=float,
+        unit="KB",
         input_processor=MapCompose(
             extract_text_from_tags, str.strip, extract_cache_size
         ),
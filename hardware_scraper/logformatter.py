@@ -0,0 +1,14 @@
+import logging
+
+from scrapy import logformatter
+
+from hardware_scraper.exceptions import UnchangedItem
+
+
+class LogFormatter(logformatter.LogFormatter):
+    def dropped(self, item, exception, response, spider):
+        entry = super().dropped(item, exception, response, spider)
+        # unchanged items are dropped by design, there are thousands of them
+        if isinstance(exception, UnchangedItem):
+            entry["level"] = logging.DEBUG
+        return entry
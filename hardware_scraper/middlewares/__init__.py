@@ -4,9 +4,18 @@ from hardware_scraper.middlewares.hardware import (
 from hardware_scraper.middlewares.hardware import (
     HardwareScraperSpiderMiddleware,
 )
+from hardware_scraper.middlewares.network_slot_middleware import (
+    NetworkSlotMiddleware,
+)
+from hardware_scraper.middlewares.parse_latency_middleware import (
+    ParseLatencyMiddleware,
+)
 from hardware_scraper.middlewares.random_proxy_middleware import (
     RandomProxyMiddleware,
 )
 from hardware_scraper.middlewares.too_many_requests_middleware import (
     TooManyRequestsRetryMiddleware,
 )
+from hardware_scraper.middlewares.wrong_page_middleware import (
+    WrongPageMiddleware,
+)
@@ -0,0 +1,51 @@
+from scrapy.core.downloader import Slot
+
+from hardware_scraper.middlewares.random_proxy_middleware import (
+    normalize_proxy,
+)
+
+
+class NetworkSlotMiddleware:
+    """Assigns requests that go to the network to per-proxy download slots.
+
+    Should be placed after HttpCacheMiddleware: cache hits are answered before
+    reaching this middleware and the downloader slots, so they aren't delayed.
+    They still count towards `CONCURRENT_REQUESTS` with the requests waiting in
+    slots, CacheAwareScheduler keeps the waiting requests few.
+    Requests without proxy use the site slot configured by `DOWNLOAD_DELAY`
+    and `CONCURRENT_REQUESTS_PER_DOMAIN`, every proxy gets its own slot with
+    `PROXY_SLOT_DELAY` and `PROXY_SLOT_CONCURRENCY`, so the request rate grows
+    with the number of proxies while each of them stays polite.
+    """
+
+    def __init__(self, crawler):
+        self.crawler = crawler
+        self.stats = crawler.stats
+        settings = crawler.settings
+        self.proxy_slot_concurrency = settings.getint("PROXY_SLOT_CONCURRENCY")
+        self.proxy_slot_delay = settings.getfloat("PROXY_SLOT_DELAY")
+        self.randomize_delay = settings.getbool("RANDOMIZE_DOWNLOAD_DELAY")
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(crawler)
+
+    def process_request(self, request, spider):
+        self.stats.inc_value("network_slot/requests", spider=spider)
+
+        # proxy can change between retries, so slot is reassigned every time
+        proxy = request.meta.get("proxy")
+        if proxy:
+            proxy = normalize_proxy(proxy)
+            request.meta["download_slot"] = proxy
+            self._add_proxy_slot(proxy, spider)
+
+    def _add_proxy_slot(self, proxy, spider):
+        # slots are created by the downloader after the middlewares with the
+        # site settings, inactive slots are removed by it, so they're recreated
+        slots = self.crawler.engine.downloader.slots
+        if proxy not in slots:
+            slots[proxy] = Slot(
+                self.proxy_slot_concurrency, self.proxy_slot_delay, self.randomize_delay
+            )
+            self.stats.inc_value("network_slot/proxy_slots", spider=spider)
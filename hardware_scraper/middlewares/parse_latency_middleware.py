@@ -0,0 +1,56 @@
+import bisect
+import time
+
+from scrapy.exceptions import NotConfigured
+
+from hardware_scraper.middlewares.wrong_page_middleware import (
+    get_callback_name,
+)
+
+# upper bounds (in seconds) of buckets of the parse latency histogram
+PARSE_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1)
+
+
+def get_bucket(seconds: float) -> str:
+    index = bisect.bisect_left(PARSE_LATENCY_BUCKETS, seconds)
+    if index == len(PARSE_LATENCY_BUCKETS):
+        return "+Inf"
+    return str(PARSE_LATENCY_BUCKETS[index])
+
+
+class ParseLatencyMiddleware:
+    """Records histograms of time spent in spider callbacks into stats.
+
+    Only the time of producing the results of callbacks is counted, not the
+    processing of results by the engine. Should be placed last among spider
+    middlewares, i.e. the closest to the spider. Histograms are kept in
+    `parse_latency/<callback>/<bucket>`, `.../count` and `.../sum` stats.
+    """
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        if not crawler.settings.getbool("METRICS_ENABLED"):
+            raise NotConfigured
+        return cls(crawler.stats)
+
+    def process_spider_output(self, response, result, spider):
+        prefix = f"parse_latency/{get_callback_name(response.request)}"
+        seconds = 0.0
+        iterator = iter(result)
+        try:
+            while True:
+                start = time.perf_counter()
+                try:
+                    output = next(iterator)
+                except StopIteration:
+                    break
+                finally:
+                    seconds += time.perf_counter() - start
+                yield output
+        finally:
+            self.stats.inc_value(f"{prefix}/{get_bucket(seconds)}", spider=spider)
+            self.stats.inc_value(f"{prefix}/count", spider=spider)
+            self.stats.inc_value(f"{prefix}/sum", seconds, start=0.0, spider=spider)
@@ -0,0 +1,138 @@
+import heapq
+import random
+import time
+from typing import Dict
+from typing import List
+from typing import Optional
+from typing import Tuple
+
+
+class ProxyState:
+    __slots__ = (
+        "address",
+        "user_pass",
+        "latency",
+        "error_rate",
+        "failures",
+        "position",
+        "cooldown_until",
+    )
+
+    def __init__(self, address: str, user_pass: str):
+        self.address = address
+        self.user_pass = user_pass
+        # exponentially weighted moving averages of latency and errors
+        self.latency: Optional[float] = None
+        self.error_rate = 0.0
+        # number of failures in a row
+        self.failures = 0
+        # index in the list of active proxies, None if proxy is cooling down
+        self.position: Optional[int] = None
+        self.cooldown_until = 0.0
+
+
+class ProxyPool:
+    """Pool of proxies with health-weighted random choice.
+
+    Proxy is chosen by rejection sampling: a uniformly random active proxy is
+    accepted with the probability equal to its weight, weights are in
+    [MIN_WEIGHT, 1], so the choice takes constant expected time. Failed proxies
+    aren't removed, they are cooling down and are readmitted after a delay
+    which doubles with every failure in a row.
+    """
+
+    EWMA_ALPHA = 0.2
+    # latency (in seconds) halving the weight of a proxy
+    LATENCY_SCALE = 5.0
+    MIN_WEIGHT = 0.05
+
+    def __init__(self, cooldown: float = 300, max_cooldown: float = 3600):
+        self.cooldown = cooldown
+        self.max_cooldown = max_cooldown
+        self.proxies: Dict[str, ProxyState] = {}
+        self.active: List[ProxyState] = []
+        # heap of (readmission time, address)
+        self.cooling: List[Tuple[float, str]] = []
+
+    def __len__(self):
+        return len(self.proxies)
+
+    def __contains__(self, address):
+        return address in self.proxies
+
+    def __getitem__(self, address) -> ProxyState:
+        return self.proxies[address]
+
+    def add(self, address: str, user_pass: str = ""):
+        proxy = ProxyState(address, user_pass)
+        self.proxies[address] = proxy
+        self._activate(proxy)
+
+    def get_weight(self, proxy: ProxyState) -> float:
+        weight = 1 - proxy.error_rate
+        if proxy.latency is not None:
+            weight *= self.LATENCY_SCALE / (self.LATENCY_SCALE + proxy.latency)
+        return max(self.MIN_WEIGHT, weight)
+
+    def choose(self) -> ProxyState:
+        self.readmit()
+        if not self.active:
+            # all proxies are cooling down, take the one that is ready first
+            _, address = heapq.heappop(self.cooling)
+            self._activate(self.proxies[address])
+        while True:
+            proxy = random.choice(self.active)
+            if random.random() < self.get_weight(proxy):
+                return proxy
+
+    def readmit(self) -> int:
+        """Return proxies with finished cooldown to the active ones."""
+        now = time.monotonic()
+        count = 0
+        while self.cooling and self.cooling[0][0] <= now:
+            _, address = heapq.heappop(self.cooling)
+            self._activate(self.proxies[address])
+            count += 1
+        return count
+
+    def record_response(self, address: str, latency: Optional[float], error: bool):
+        proxy = self.proxies[address]
+        alpha = self.EWMA_ALPHA
+        proxy.error_rate += alpha * (float(error) - proxy.error_rate)
+        if latency is not None:
+            if proxy.latency is None:
+                proxy.latency = latency
+            else:
+                proxy.latency += alpha * (latency - proxy.latency)
+        if not error:
+            proxy.failures = 0
+
+    def record_failure(self, address: str) -> Optional[float]:
+        """Send the proxy to cooldown, returns its duration in seconds.
+
+        Returns None if the proxy is already cooling down.
+        """
+        proxy = self.proxies[address]
+        self.record_response(address, latency=None, error=True)
+        if proxy.position is None:
+            # failure of a request sent before the proxy was cooled down
+            return None
+        proxy.failures += 1
+
+        cooldown = min(self.max_cooldown, self.cooldown * 2 ** (proxy.failures - 1))
+        self._deactivate(proxy)
+        proxy.cooldown_until = time.monotonic() + cooldown
+        heapq.heappush(self.cooling, (proxy.cooldown_until, address))
+        return cooldown
+
+    def _activate(self, proxy: ProxyState):
+        proxy.position = len(self.active)
+        self.active.append(proxy)
+
+    def _deactivate(self, proxy: ProxyState):
+        # swap with the last one to remove in constant time
+        last = self.active.pop()
+        if last is not proxy:
+            self.active[proxy.position] = last
+            last.position = proxy.position
+        proxy.position = None
@@ -18,23 +18,83 @@
 # OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN
 # THE SOFTWARE.
 
-import base64
 import logging
 import random
 import re
+from typing import Optional
+from typing import Tuple
+from urllib.parse import urlparse
+
+from scrapy import signals
+
+from hardware_scraper.middlewares.proxy_pool import ProxyPool
+from hardware_scraper.signals import metrics_requested
 
 log = logging.getLogger("scrapy.proxies")
 
+PROXY_PATTERN = re.compile(r"(\w+://)([^:]+?:[^@]+?@)?(.+)")
+DEFAULT_PORTS = {"http": 80, "https": 443}
+
 
 class Mode:
     RANDOMIZE_PROXY_EVERY_REQUESTS, RANDOMIZE_PROXY_ONCE, SET_CUSTOM_PROXY = range(3)
 
 
+def normalize_proxy(url: str) -> str:
+    """Get address `scheme://host:port` of proxy url without credentials.
+
+    Proxies are identified by addresses in the pool, download slots and stats,
+    HttpProxyMiddleware removes credentials from `proxy` meta of requests.
+    """
+    parts = urlparse(url)
+    host = parts.hostname
+    if ":" in host:
+        host = f"[{host}]"
+    port = parts.port or DEFAULT_PORTS.get(parts.scheme)
+    if port is None:
+        return f"{parts.scheme}://{host}"
+    return f"{parts.scheme}://{host}:{port}"
+
+
+def parse_proxy(line: str) -> Optional[Tuple[str, str]]:
+    """Split proxy url into normalized address and user:pass."""
+    parts = PROXY_PATTERN.match(line.strip())
+    if not parts:
+        return None
+
+    # Cut trailing @
+    if parts.group(2):
+        user_pass = parts.group(2)[:-1]
+    else:
+        user_pass = ""
+    return normalize_proxy(parts.group(1) + parts.group(3)), user_pass
+
+
 class RandomProxyMiddleware:
-    def __init__(self, settings):
-        self.mode = settings.get("PROXY_MODE")
+    """Sets proxies to requests choosing them from the ProxyPool.
+
+    Should be placed before HttpProxyMiddleware, which sets credentials of proxies.
+    Proxies failed with an exception are cooling down for `PROXY_COOLDOWN`
+    seconds (doubled with every failure in a row), responses with
+    `PROXY_ERROR_HTTP_CODES` lower the chance of the proxy to be chosen.
+    `CONCURRENT_REQUESTS` is raised by the number of proxies multiplied by
+    `PROXY_SLOT_CONCURRENCY`, so the global limit doesn't cap proxy slots.
+    """
+
+    def __init__(self, settings, stats, crawler=None):
+        self.crawler = crawler
+        self.mode = settings.getint("PROXY_MODE")
+        self.proxy_slot_concurrency = settings.getint("PROXY_SLOT_CONCURRENCY")
         self.proxy_list = settings.get("PROXY_LIST")
+        self.error_http_codes = set(
+            map(int, settings.getlist("PROXY_ERROR_HTTP_CODES"))
+        )
+        self.stats = stats
         self.chosen_proxy = ""
+        self.proxies = ProxyPool(
+            cooldown=settings.getfloat("PROXY_COOLDOWN"),
+            max_cooldown=settings.getfloat("PROXY_MAX_COOLDOWN"),
+        )
 
         if (
             self.mode == Mode.RANDOMIZE_PROXY_EVERY_REQUESTS
@@ -42,87 +102,146 @@ class RandomProxyMiddleware:
         ):
             if self.proxy_list is None:
                 raise KeyError("PROXY_LIST setting is missing")
-            self.proxies = {}
-            fin = open(self.proxy_list)
-            try:
-                for line in fin.readlines():
-                    parts = re.match("(\w+://)([^:]+?:[^@]+?@)?(.+)", line.strip())
-                    if not parts:
+            with open(self.proxy_list) as fin:
+                for number, line in enumerate(fin, start=1):
+                    try:
+                        proxy = parse_proxy(line)
+                    except ValueError as e:
+                        # e.g. a port that isn't a number
+                        log.warning(
+                            "Skipping proxy on line %d of %s: %s"
+                            % (number, self.proxy_list, e)
+                        )
                         continue
-
-                    # Cut trailing @
-                    if parts.group(2):
-                        user_pass = parts.group(2)[:-1]
-                    else:
-                        user_pass = ""
-
-                    self.proxies[parts.group(1) + parts.group(3)] = user_pass
-            finally:
-                fin.close()
+                    if proxy is not None:
+                        self.proxies.add(*proxy)
+            if len(self.proxies) == 0:
+                raise ValueError(f"There are no proxies in {self.proxy_list}")
             if self.mode == Mode.RANDOMIZE_PROXY_ONCE:
-                self.chosen_proxy = random.choice(list(self.proxies.keys()))
+                self.chosen_proxy = self.proxies.choose().address
         elif self.mode == Mode.SET_CUSTOM_PROXY:
-            custom_proxy = settings.get("CUSTOM_PROXY")
-            self.proxies = {}
-            parts = re.match("(\w+://)([^:]+?:[^@]+?@)?(.+)", custom_proxy.strip())
-            if not parts:
+            proxy = parse_proxy(settings.get("CUSTOM_PROXY"))
+            if proxy is None:
                 raise ValueError("CUSTOM_PROXY is not well formatted")
-
-            if parts.group(2):
-                user_pass = parts.group(2)[:-1]
-            else:
-                user_pass = ""
-
-            self.proxies[parts.group(1) + parts.group(3)] = user_pass
-            self.chosen_proxy = parts.group(1) + parts.group(3)
+            self.proxies.add(*proxy)
+            self.chosen_proxy = proxy[0]
 
     @classmethod
     def from_crawler(cls, crawler):
-        return cls(crawler.settings)
+        middleware = cls(crawler.settings, crawler.stats, crawler)
+        crawler.signals.connect(middleware.spider_opened, signal=signals.spider_opened)
+        crawler.signals.connect(middleware.spider_closed, signal=signals.spider_closed)
+        crawler.signals.connect(middleware.metrics_requested, signal=metrics_requested)
+        return middleware
+
+    def spider_opened(self, spider):
+        # the downloader is created with CONCURRENT_REQUESTS before the spider
+        # is opened, every proxy has its own slot (see NetworkSlotMiddleware)
+        downloader = self.crawler.engine.downloader
+        downloader.total_concurrency += len(self.proxies) * self.proxy_slot_concurrency
+        log.info(
+            "Concurrent requests are raised to %d for %d proxies"
+            % (downloader.total_concurrency, len(self.proxies))
+        )
 
     def process_request(self, request, spider):
         # Don't overwrite with a random one (server-side state for IP)
         if "proxy" in request.meta:
-            if request.meta["exception"] is False:
+            if request.meta.get("exception") is False:
                 return
         request.meta["exception"] = False
-        if len(self.proxies) == 0:
-            raise ValueError("All proxies are unusable, cannot proceed")
 
         if self.mode == Mode.RANDOMIZE_PROXY_EVERY_REQUESTS:
-            proxy_address = random.choice(list(self.proxies.keys()))
+            # the less loaded of two random proxies, so all proxy slots are busy
+            proxy = self.proxies.choose()
+            other = self.proxies.choose()
+            if self._get_slot_load(other.address) < self._get_slot_load(proxy.address):
+                proxy = other
         else:
-            proxy_address = self.chosen_proxy
-
-        proxy_user_pass = self.proxies[proxy_address]
+            proxy = self.proxies[self.chosen_proxy]
 
-        if proxy_user_pass:
-            request.meta["proxy"] = proxy_address
-            basic_auth = "Basic " + base64.b64encode(proxy_user_pass.encode()).decode()
-            request.headers["Proxy-Authorization"] = basic_auth
+        if proxy.user_pass:
+            # HttpProxyMiddleware moves credentials into Proxy-Authorization
+            # header and keeps it on retries
+            scheme, host = proxy.address.split("://", 1)
+            request.meta["proxy"] = f"{scheme}://{proxy.user_pass}@{host}"
         else:
-            request.meta["proxy"] = proxy_address
+            request.meta["proxy"] = proxy.address
             log.debug("Proxy user pass not found")
+        self.stats.inc_value(f"proxy/requests/{proxy.address}", spider=spider)
+        self._set_pool_stats(spider)
         log.debug(
-            "Using proxy <%s>, %d proxies left" % (proxy_address, len(self.proxies))
+            "Using proxy <%s>, %d of %d proxies are active"
+            % (proxy.address, len(self.proxies.active), len(self.proxies))
         )
 
+    def metrics_requested(self, spider):
+        # proxies are readmitted only when chosen, requests may not come for long
+        self.proxies.readmit()
+        self._set_pool_stats(spider)
+
+    def _set_pool_stats(self, spider):
+        self.stats.set_value("proxy/active", len(self.proxies.active), spider=spider)
+        self.stats.set_value("proxy/count", len(self.proxies), spider=spider)
+
+    def _get_slot_load(self, address: str) -> int:
+        # number of queued and downloading requests, proxies have own download
+        # slots (see NetworkSlotMiddleware)
+        if self.crawler is None or self.crawler.engine is None:
+            return 0
+        slot = self.crawler.engine.downloader.slots.get(address)
+        return len(slot.active) if slot is not None else 0
+
+    @staticmethod
+    def _get_request_proxy(request) -> Optional[str]:
+        proxy = request.meta.get("proxy")
+        return normalize_proxy(proxy) if proxy else None
+
+    def process_response(self, request, response, spider):
+        proxy = self._get_request_proxy(request)
+        if proxy not in self.proxies:
+            return response
+
+        error = response.status in self.error_http_codes
+        self.proxies.record_response(
+            proxy, latency=request.meta.get("download_latency"), error=error
+        )
+        self.stats.inc_value(f"proxy/responses/{proxy}", spider=spider)
+        if error:
+            self.stats.inc_value(f"proxy/errors/{proxy}", spider=spider)
+        return response
+
     def process_exception(self, request, exception, spider):
-        if "proxy" not in request.meta:
+        proxy = self._get_request_proxy(request)
+        if proxy not in self.proxies:
             return
+        self.stats.inc_value(f"proxy/errors/{proxy}", spider=spider)
         if (
             self.mode == Mode.RANDOMIZE_PROXY_EVERY_REQUESTS
             or self.mode == Mode.RANDOMIZE_PROXY_ONCE
         ):
-            proxy = request.meta["proxy"]
-            try:
-                del self.proxies[proxy]
-            except KeyError:
-                pass
             request.meta["exception"] = True
-            if self.mode == Mode.RANDOMIZE_PROXY_ONCE:
-                self.chosen_proxy = random.choice(list(self.proxies.keys()))
+            cooldown = self.proxies.record_failure(proxy)
+            if self.mode == Mode.RANDOMIZE_PROXY_ONCE and proxy == self.chosen_proxy:
+                self.chosen_proxy = self.proxies.choose().address
+            if cooldown is None:
+                return
+            self.stats.inc_value("proxy/cooldowns", spider=spider)
+            self._set_pool_stats(spider)
             log.info(
-                "Removing failed proxy <%s>, %d proxies left"
-                % (proxy, len(self.proxies))
+                "Cooling down failed proxy <%s> for %d seconds, "
+                "%d of %d proxies are active"
+                % (proxy, cooldown, len(self.proxies.active), len(self.proxies))
+            )
+
+    def spider_closed(self, spider):
+        for address, proxy in self.proxies.proxies.items():
+            if proxy.latency is not None:
+                self.stats.set_value(
+                    f"proxy/latency/{address}", round(proxy.latency, 3), spider=spider
+                )
+            self.stats.set_value(
+                f"proxy/weight/{address}",
+                round(self.proxies.get_weight(proxy), 3),
+                spider=spider,
             )
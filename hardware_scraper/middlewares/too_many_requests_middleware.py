@@ -1,50 +1,108 @@
+import random
 from http import HTTPStatus
 
 from scrapy.downloadermiddlewares.retry import RetryMiddleware
 from scrapy.utils.response import response_status_message
-from twisted.internet import defer
 from twisted.internet import reactor
 
 
-async def async_sleep(delay, return_value=None):
-    deferred = defer.Deferred()
-    reactor.callLater(delay, deferred.callback, return_value)
-    return await deferred
-
-
 class TooManyRequestsRetryMiddleware(RetryMiddleware):
-    """Modifies RetryMiddleware to delay retries on status 429."""
+    """Modifies RetryMiddleware to back off the download slot on status 429.
+
+    Only the slot that got 429 is delayed (the site or the proxy, see
+    NetworkSlotMiddleware), other slots and cache hits keep flowing. Retries
+    of 429 go through another proxy, the 429 lowers the weight of the proxy
+    in the pool (see `PROXY_ERROR_HTTP_CODES` of RandomProxyMiddleware).
+    """
 
     DEFAULT_DELAY = 60  # Delay in seconds.
     MAX_DELAY = 1800  # Sometimes, RETRY-AFTER has absurd values
+    JITTER = 0.2  # Relative random addition to the delay
+
+    def __init__(self, settings):
+        super().__init__(settings)
+        # number of 429 in a row for each slot
+        self.slot_attempts = {}
+        # delay settings of slots to restore after backoff and restoring calls
+        self.slot_originals = {}
+        self.slot_restores = {}
 
-    async def process_response(self, request, response, spider):
+    def process_response(self, request, response, spider):
         """
         Like RetryMiddleware.process_response, but, if response status is 429,
-        retry the request only after waiting at most self.MAX_DELAY seconds.
+        the download slot of the request is backed off before the retry.
         Respect the Retry-After header if it's less than self.MAX_DELAY.
         If Retry-After is absent/invalid, wait only self.DEFAULT_DELAY seconds.
+        The delay is doubled for every 429 in a row on the same slot.
         """
 
         if request.meta.get("dont_retry", False):
             return response
 
+        # cache hits don't have a slot
+        slot_key = request.meta.get("download_slot")
+
         if response.status in self.retry_http_codes:
             if response.status == HTTPStatus.TOO_MANY_REQUESTS:
-                retry_after = response.headers.get("retry-after")
-                try:
-                    retry_after = int(retry_after)
-                except (ValueError, TypeError):
-                    delay = self.DEFAULT_DELAY
-                else:
-                    delay = min(self.MAX_DELAY, retry_after)
-                spider.logger.info(f"Retrying {request} in {delay} seconds.")
-
-                spider.crawler.engine.pause()
-                await async_sleep(delay)
-                spider.crawler.engine.unpause()
+                delay = self._get_delay(slot_key, response)
+                spider.logger.info(
+                    f"Retrying {request} in {delay:.0f} seconds, "
+                    f"backing off slot: {slot_key}."
+                )
+                self._backoff_slot(slot_key, delay, spider)
 
             reason = response_status_message(response.status)
-            return self._retry(request, reason, spider) or response
+            retry_request = self._retry(request, reason, spider)
+            if retry_request is None:
+                return response
+            if response.status == HTTPStatus.TOO_MANY_REQUESTS:
+                # let RandomProxyMiddleware choose a proxy and its slot again
+                retry_request.meta.pop("proxy", None)
+                retry_request.meta.pop("download_slot", None)
+            return retry_request
 
+        self.slot_attempts.pop(slot_key, None)
         return response
+
+    def _get_delay(self, slot_key, response):
+        retry_after = response.headers.get("retry-after")
+        try:
+            retry_after = int(retry_after)
+        except (ValueError, TypeError):
+            delay = self.DEFAULT_DELAY
+        else:
+            delay = min(self.MAX_DELAY, retry_after)
+
+        attempt = self.slot_attempts.get(slot_key, 0) + 1
+        self.slot_attempts[slot_key] = attempt
+        delay *= 2 ** (attempt - 1) * random.uniform(1, 1 + self.JITTER)
+        return min(self.MAX_DELAY, delay)
+
+    def _backoff_slot(self, slot_key, delay, spider):
+        stats = spider.crawler.stats
+        stats.inc_value("too_many_requests/count", spider=spider)
+        stats.inc_value("too_many_requests/backoff_time", delay, spider=spider)
+        stats.inc_value(
+            f"too_many_requests/backoff_time/{slot_key}", delay, spider=spider
+        )
+
+        slot = spider.crawler.engine.downloader.slots.get(slot_key)
+        if slot is None:
+            return
+
+        # slot can't send next request earlier than `delay` after the previous one
+        if slot_key not in self.slot_originals:
+            self.slot_originals[slot_key] = (slot.delay, slot.randomize_delay)
+        slot.delay = max(self.slot_originals[slot_key][0], delay)
+        slot.randomize_delay = False
+
+        restore = self.slot_restores.get(slot_key)
+        if restore is not None and restore.active():
+            restore.cancel()
+        self.slot_restores[slot_key] = reactor.callLater(
+            delay, self._restore_slot, slot_key, slot
+        )
+
+    def _restore_slot(self, slot_key, slot):
+        self.slot_restores.pop(slot_key, None)
+        slot.delay, slot.randomize_delay = self.slot_originals.pop(slot_key)
@@ -0,0 +1,57 @@
+from http import HTTPStatus
+
+from scrapy.downloadermiddlewares.retry import get_retry_request
+from scrapy.exceptions import IgnoreRequest
+from scrapy.http import TextResponse
+
+
+def get_callback_name(request) -> str:
+    return request.callback.__name__ if request.callback is not None else "parse"
+
+
+def is_expected_page(response, signature: str) -> bool:
+    """Check that response has the element of the page signature (css selector)."""
+    return isinstance(response, TextResponse) and bool(response.css(signature).get())
+
+
+class WrongPageMiddleware:
+    """Retries responses that aren't the pages expected by the request callback.
+
+    Proxies sometimes return their own pages (captchas, errors) with status 200.
+    Spiders declare `page_signatures`: css selectors of elements which should be
+    on the pages of each callback. Wrong pages are retried within RETRY_TIMES
+    on another proxy and don't get to the spider.
+
+    Should be placed after HttpCacheMiddleware, so wrong pages aren't cached.
+    Wrong pages that are already in the cache are replaced by their retries.
+    """
+
+    def __init__(self, stats):
+        self.stats = stats
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        return cls(crawler.stats)
+
+    def process_response(self, request, response, spider):
+        if response.status != HTTPStatus.OK:
+            return response
+        signature = getattr(spider, "page_signatures", {}).get(
+            get_callback_name(request)
+        )
+        if signature is None or is_expected_page(response, signature):
+            return response
+
+        self.stats.inc_value("wrong_page/count", spider=spider)
+        retry_request = get_retry_request(request, spider=spider, reason="wrong page")
+        if retry_request is None:
+            raise IgnoreRequest(f"Wrong page: {response.url}")
+
+        # choose another proxy (see RandomProxyMiddleware)
+        retry_request.meta["exception"] = True
+        if "cached" in response.flags:
+            # download the page again and replace the wrong one in the cache
+            # (see RefreshCachePolicy)
+            self.stats.inc_value("wrong_page/cached", spider=spider)
+            retry_request.meta["refresh_cache"] = True
+        return retry_request
@@ -0,0 +1,6 @@
+from hardware_scraper.pipelines.batching_pipeline import BatchingPipeline
+from hardware_scraper.pipelines.batching_pipeline import ItemSink
+from hardware_scraper.pipelines.change_detection_pipeline import (
+    ChangeDetectionPipeline,
+)
+from hardware_scraper.pipelines.sqlite_sink import SqliteItemSink
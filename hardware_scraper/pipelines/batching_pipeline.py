@@ -0,0 +1,116 @@
+# Define your item pipelines here
+#
+# Don't forget to add your pipeline to the ITEM_PIPELINES setting
+# See: https://docs.scrapy.org/en/latest/topics/item-pipeline.html
+
+import logging
+from functools import lru_cache
+from typing import Any
+from typing import Dict
+from typing import List
+
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+from scrapy.utils.conf import build_component_list
+from scrapy.utils.misc import create_instance
+from scrapy.utils.misc import load_object
+
+from hardware_scraper.signals import items_flushed
+
+logger = logging.getLogger(__name__)
+
+
+@lru_cache(maxsize=None)
+def get_default_values(item_cls) -> Dict[str, Any]:
+    """Template of values of fields missing in scraped items."""
+    return dict.fromkeys(item_cls.fields)
+
+
+def fill_defaults(item):
+    defaults = get_default_values(type(item))
+    missing = defaults.keys() - item.keys()
+    if missing:
+        # fields are sorted like in `item.fields`
+        item.update({field: defaults[field] for field in sorted(missing)})
+    return item
+
+
+class ItemSink:
+    """Base class of consumers of item batches listed in ITEM_SINKS setting.
+
+    Sinks can raise NotConfigured in `from_crawler` or `__init__` to be disabled.
+    """
+
+    def open_spider(self, spider):
+        pass
+
+    def process_batch(self, items: List, spider):
+        raise NotImplementedError
+
+    def close_spider(self, spider):
+        pass
+
+
+class BatchingPipeline:
+    """Fills missing fields of items and passes items to sinks by batches.
+
+    Items are returned right away, so feed exports aren't delayed. The last
+    incomplete batch is flushed when the spider is closed. `items_flushed` is
+    sent after sinks processed a batch (see IncrementalCrawl).
+    """
+
+    def __init__(self, sinks: List[ItemSink], batch_size: int, signals=None):
+        self.sinks = sinks
+        self.batch_size = batch_size
+        self.signals = signals
+        self.batch = []
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        sinks = []
+        for path in build_component_list(crawler.settings.getdict("ITEM_SINKS")):
+            try:
+                sink = create_instance(load_object(path), crawler.settings, crawler)
+            except NotConfigured as e:
+                if e.args:
+                    logger.warning(f"Disabled {path}: {e.args[0]}")
+                continue
+            sinks.append(sink)
+
+        pipeline = cls(
+            sinks,
+            batch_size=crawler.settings.getint("ITEM_BATCH_SIZE"),
+            signals=crawler.signals,
+        )
+        crawler.signals.connect(pipeline.spider_closed, signal=signals.spider_closed)
+        return pipeline
+
+    def open_spider(self, spider):
+        for sink in self.sinks:
+            sink.open_spider(spider)
+
+    def process_item(self, item, spider):
+        fill_defaults(item)
+        if self.sinks:
+            self.batch.append(item)
+            if len(self.batch) >= self.batch_size:
+                self.flush(spider)
+        return item
+
+    def flush(self, spider):
+        batch, self.batch = self.batch, []
+        if not batch:
+            return
+        for sink in self.sinks:
+            sink.process_batch(batch, spider)
+        if self.signals is not None:
+            self.signals.send_catch_log(items_flushed, items=batch, spider=spider)
+
+    def close_spider(self, spider):
+        # before spider_closed, so extensions get the last batch in time
+        self.flush(spider)
+
+    def spider_closed(self, spider):
+        self.flush(spider)
+        for sink in self.sinks:
+            sink.close_spider(spider)
@@ -0,0 +1,138 @@
+import datetime
+import hashlib
+import json
+import logging
+import pathlib
+from typing import Any
+from typing import Dict
+from typing import List
+
+from scrapy import signals
+from scrapy.exceptions import NotConfigured
+from scrapy.exporters import JsonLinesItemExporter
+
+from hardware_scraper.exceptions import UnchangedItem
+from hardware_scraper.extensions.utils import load_json
+from hardware_scraper.extensions.utils import save_json
+
+logger = logging.getLogger(__name__)
+
+
+def get_values(item) -> Dict[str, Any]:
+    # missing fields are the same as empty ones
+    return {field: item.get(field) for field in sorted(item.fields)}
+
+
+def get_content_hash(values: Dict[str, Any]) -> str:
+    return hashlib.sha1(json.dumps(values, sort_keys=True).encode()).hexdigest()
+
+
+def get_diff(old: Dict[str, Any], new: Dict[str, Any]) -> Dict[str, list]:
+    return {
+        field: [old.get(field), value]
+        for field, value in new.items()
+        if old.get(field) != value
+    }
+
+
+class ChangeDetectionPipeline:
+    """Passes only products added or modified since the previous crawl.
+
+    Values, content hashes and pages of products are kept in
+    `CHANGES_DIR/<spider>.json`, added, modified (with field-level diff) and
+    removed products are written to a change feed `CHANGES_DIR/<spider>_<time>.jl`.
+    Products are removed if their listing page is fetched by a finished crawl,
+    but their page isn't on any fetched listing page, so products which failed
+    or were skipped (incremental and listing index modes) aren't removed.
+    """
+
+    def __init__(self, directory: pathlib.Path, stats):
+        self.directory = directory
+        self.stats = stats
+        self.products: Dict[str, Dict] = {}
+        self.seen = set()
+        self.feed_file = None
+        self.exporter = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        if not settings.getbool("CHANGES_ENABLED"):
+            raise NotConfigured
+        pipeline = cls(
+            directory=pathlib.Path(settings.get("CHANGES_DIR")),
+            stats=crawler.stats,
+        )
+        crawler.signals.connect(pipeline.spider_closed, signal=signals.spider_closed)
+        crawler.signals.connect(pipeline.item_scraped, signal=signals.item_scraped)
+        crawler.signals.connect(pipeline.item_dropped, signal=signals.item_dropped)
+        return pipeline
+
+    def _get_state_path(self, spider) -> pathlib.Path:
+        return self.directory.joinpath(f"{spider.name}.json")
+
+    def open_spider(self, spider):
+        self.products = load_json(self._get_state_path(spider), default={})
+        time = datetime.datetime.utcnow().replace(microsecond=0).isoformat()
+        feed_path = self.directory.joinpath(
+            f"{spider.name}_{time.replace(':', '-')}.jl"
+        )
+        feed_path.parent.mkdir(parents=True, exist_ok=True)
+        self.feed_file = feed_path.open("wb")
+        self.exporter = JsonLinesItemExporter(self.feed_file)
+        self.exporter.start_exporting()
+
+    def process_item(self, item, spider):
+        key = item[item.key_field]
+        values = get_values(item)
+        content_hash = get_content_hash(values)
+        self.seen.add(key)
+
+        previous = self.products.get(key)
+        if previous is not None and previous["hash"] == content_hash:
+            self.stats.inc_value("changes/unchanged", spider=spider)
+            raise UnchangedItem(f"Unchanged: {key}")
+
+        if previous is None:
+            self._export_change(spider, "added", key, item=values)
+        else:
+            diff = get_diff(previous["values"], values)
+            self._export_change(spider, "modified", key, item=values, diff=diff)
+        self.products[key] = {"hash": content_hash, "values": values}
+        return item
+
+    def item_scraped(self, item, response, spider):
+        product = self.products.get(item.get(item.key_field))
+        if product is not None:
+            product["url"] = response.url
+            product["listing"] = response.meta.get("listing_url")
+
+    def item_dropped(self, item, response, exception, spider):
+        # unchanged products are on the site too
+        self.item_scraped(item, response, spider)
+
+    def _get_removed(self, listings: Dict[str, List[str]]) -> List[str]:
+        listed = {url for urls in listings.values() for url in urls}
+        return sorted(
+            key
+            for key, product in self.products.items()
+            if key not in self.seen
+            and product.get("listing") in listings
+            and product.get("url") not in listed
+        )
+
+    def _export_change(self, spider, change: str, key: str, **record):
+        self.stats.inc_value(f"changes/{change}", spider=spider)
+        self.exporter.export_item({"change": change, "key": key, **record})
+
+    def spider_closed(self, spider, reason):
+        if reason == "finished":
+            # product links of listing pages fetched on this run (see HardwareSpider)
+            for key in self._get_removed(getattr(spider, "listed_products", {})):
+                self._export_change(spider, "removed", key)
+                del self.products[key]
+
+        self.exporter.finish_exporting()
+        self.feed_file.close()
+        save_json(self._get_state_path(spider), self.products)
+        logger.info(f"Changes are written into: {self.feed_file.name}")
@@ -0,0 +1,124 @@
+import json
+import logging
+import os
+import sqlite3
+from typing import List
+from typing import NamedTuple
+from typing import Optional
+
+from scrapy.exceptions import NotConfigured
+
+from hardware_scraper.pipelines.batching_pipeline import ItemSink
+
+logger = logging.getLogger(__name__)
+
+SQL_TYPES = {str: "TEXT", int: "INTEGER", float: "REAL", bool: "INTEGER", list: "TEXT"}
+INDEXED_FIELDS = ("manufacturer", "release_date", "architecture", "generation")
+
+
+class Table(NamedTuple):
+    name: str
+    key: str
+    columns: List[str]
+
+
+def get_table(item_cls, name: str) -> Table:
+    # key goes first, other columns are sorted like in `item.fields`
+    key = item_cls.key_field
+    columns = [key] + [field for field in item_cls.fields if field != key]
+    return Table(name, key, columns)
+
+
+def get_column_type(item_cls, field: str) -> str:
+    return SQL_TYPES[item_cls.fields[field].get("dtype", str)]
+
+
+class SqliteItemSink(ItemSink):
+    """Upserts scraped items into SQLite database, one table per spider.
+
+    Tables are named by spiders and have columns of fields of their `item_cls`.
+    Items are updated in place by their `key_field`, so incremental crawls
+    keep the database up to date. Every batch is written in one transaction.
+    """
+
+    def __init__(self, path: str):
+        self.path = path
+        self.db = None
+        self.item_cls = None
+        self.table: Optional[Table] = None
+
+    @classmethod
+    def from_crawler(cls, crawler):
+        settings = crawler.settings
+        if not settings.getbool("SQLITE_SINK_ENABLED"):
+            raise NotConfigured
+        return cls(path=settings.get("SQLITE_SINK_PATH"))
+
+    def open_spider(self, spider):
+        os.makedirs(os.path.dirname(os.path.abspath(self.path)), exist_ok=True)
+        self.db = sqlite3.connect(self.path)
+        self.db.execute("PRAGMA journal_mode=WAL")
+        self.db.execute("PRAGMA synchronous=NORMAL")
+        self.item_cls = spider.item_cls
+        self.table = get_table(self.item_cls, spider.name)
+        with self.db:
+            self._create_table(self.item_cls, self.table)
+
+    def _create_table(self, item_cls, table: Table):
+        columns = ", ".join(
+            f"{column} {get_column_type(item_cls, column)}" for column in table.columns
+        )
+        self.db.execute(
+            f"CREATE TABLE IF NOT EXISTS {table.name} "
+            f"({columns}, PRIMARY KEY ({table.key}))"
+        )
+        # fields added to items after the table was created
+        existing = {
+            row[1] for row in self.db.execute(f"PRAGMA table_info({table.name})")
+        }
+        for column in table.columns:
+            if column not in existing:
+                column_type = get_column_type(item_cls, column)
+                self.db.execute(
+                    f"ALTER TABLE {table.name} ADD COLUMN {column} {column_type}"
+                )
+        for column in INDEXED_FIELDS:
+            if column in item_cls.fields:
+                self.db.execute(
+                    f"CREATE INDEX IF NOT EXISTS {table.name}_{column} "
+                    f"ON {table.name} ({column})"
+                )
+
+    def process_batch(self, items: List, spider):
+        rows = [
+            [self._to_sql(item.get(column)) for column in self.table.columns]
+            for item in items
+            if isinstance(item, self.item_cls)
+        ]
+        with self.db:
+            self.db.executemany(self._get_upsert_query(self.table), rows)
+        spider.crawler.stats.inc_value("sqlite_sink/upserted", len(rows), spider=spider)
+
+    @staticmethod
+    def _to_sql(value):
+        if isinstance(value, list):
+            return json.dumps(value)
+        return value
+
+    @staticmethod
+    def _get_upsert_query(table: Table) -> str:
+        columns = ", ".join(table.columns)
+        placeholders = ", ".join("?" for _ in table.columns)
+        updates = ", ".join(
+            f"{column} = excluded.{column}"
+            for column in table.columns
+            if column != table.key
+        )
+        return (
+            f"INSERT INTO {table.name} ({columns}) VALUES ({placeholders}) "
+            f"ON CONFLICT ({table.key}) DO UPDATE SET {updates}"
+        )
+
+    def close_spider(self, spider):
+        self.db.close()
+        logger.info(f"Items are saved into SQLite database: {self.path}")
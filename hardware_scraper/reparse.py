@@ -0,0 +1,123 @@
+import gzip
+import logging
+import os
+import pickle
+import sqlite3
+import zlib
+from http import HTTPStatus
+from itertools import islice
+from multiprocessing import Pool
+from typing import Iterator
+from typing import List
+from typing import NamedTuple
+
+from scrapy import Item
+from scrapy import Request
+from scrapy.http import Headers
+from scrapy.responsetypes import responsetypes
+from w3lib.http import headers_raw_to_dict
+
+from hardware_scraper.httpcache import iter_filesystem_cache
+from hardware_scraper.middlewares.wrong_page_middleware import is_expected_page
+
+logger = logging.getLogger(__name__)
+
+
+class CachedResponse(NamedTuple):
+    url: str
+    status: int
+    headers: bytes
+    body: bytes
+    # body is compressed with zlib in SqliteCacheStorage
+    compressed: bool
+
+
+def is_details_page(spider_cls, url: str, status: int) -> bool:
+    return status == HTTPStatus.OK and not url.startswith(
+        spider_cls.get_listing_url_prefix()
+    )
+
+
+def iter_sqlite_cache(dbpath, spider_cls) -> Iterator[CachedResponse]:
+    db = sqlite3.connect(dbpath)
+    try:
+        rows = db.execute(
+            "SELECT response_url, status, headers, body FROM responses "
+            "WHERE spider = ? ORDER BY url",
+            (spider_cls.name,),
+        )
+        for url, status, headers, body in rows:
+            if is_details_page(spider_cls, url, status):
+                yield CachedResponse(url, status, headers, body, compressed=True)
+    finally:
+        db.close()
+
+
+def iter_filesystem_cache_responses(
+    cachedir, spider_cls, gzipped=False
+) -> Iterator[CachedResponse]:
+    open_file = gzip.open if gzipped else open
+    for name, _, rpath in iter_filesystem_cache(cachedir):
+        if name != spider_cls.name:
+            continue
+        try:
+            with open_file(os.path.join(rpath, "pickled_meta"), "rb") as f:
+                metadata = pickle.load(f)
+            url = metadata.get("response_url", metadata["url"])
+            if not is_details_page(spider_cls, url, metadata["status"]):
+                continue
+            with open_file(os.path.join(rpath, "response_headers"), "rb") as f:
+                headers = f.read()
+            with open_file(os.path.join(rpath, "response_body"), "rb") as f:
+                body = f.read()
+        except FileNotFoundError:
+            logger.warning(f"Skipping incomplete cache entry: {rpath}")
+            continue
+        yield CachedResponse(url, metadata["status"], headers, body, compressed=False)
+
+
+_spider = None
+_callback = None
+
+
+def _init_worker(spider_cls):
+    global _spider, _callback
+    _spider = spider_cls()
+    _callback = getattr(_spider, spider_cls.details_callback)
+
+
+def _parse(cached: CachedResponse) -> List[Item]:
+    headers = Headers(headers_raw_to_dict(cached.headers))
+    body = zlib.decompress(cached.body) if cached.compressed else cached.body
+    respcls = responsetypes.from_args(headers=headers, url=cached.url)
+    response = respcls(
+        url=cached.url,
+        headers=headers,
+        status=cached.status,
+        body=body,
+        request=Request(cached.url),
+    )
+    signature = _spider.page_signatures.get(_callback.__name__)
+    if signature is not None and not is_expected_page(response, signature):
+        logger.warning(f"Skipping wrong cached page: {cached.url}")
+        return []
+    try:
+        return list(_callback(response))
+    except Exception:
+        logger.exception(f"Error parsing cached response: {cached.url}")
+        return []
+
+
+def reparse(spider_cls, responses, processes=None, batch_size=1000) -> Iterator[Item]:
+    """Parse cached detail pages with spider callback in a process pool.
+
+    Responses are sent to the pool in batches to bound memory usage.
+    """
+    responses = iter(responses)
+    with Pool(processes, initializer=_init_worker, initargs=(spider_cls,)) as pool:
+        while True:
+            batch = list(islice(responses, batch_size))
+            if not batch:
+                break
+            for items in pool.imap(_parse, batch, chunksize=16):
+                yield from items
@@ -0,0 +1,77 @@
+from typing import Optional
+
+from scrapy.core.scheduler import Scheduler
+from scrapy.downloadermiddlewares.httpcache import HttpCacheMiddleware
+
+
+class CacheAwareScheduler(Scheduler):
+    """Keeps requests to the network in the scheduler until download slots free up.
+
+    Requests are looked up in HTTPCACHE when they are enqueued. Cache hits are
+    given to the downloader right away, misses are kept in a separate priority
+    queue and are given only while download slots have fewer waiting requests
+    than there are slots. So priorities of requests, not FIFO queues of slots,
+    decide the order of requests to the network. Misses are recognized with
+    RefreshCachePolicy and SqliteCacheStorage, with JOBDIR all requests are
+    kept together in the disk queue.
+    """
+
+    def open(self, spider):
+        self.network_mqs = self._mq()
+        self.cache: Optional[HttpCacheMiddleware] = None
+        self.cache_found = False
+        return super().open(spider)
+
+    def __len__(self) -> int:
+        return super().__len__() + len(self.network_mqs)
+
+    def enqueue_request(self, request) -> bool:
+        if self.dqs is not None or self._is_cache_hit(request):
+            return super().enqueue_request(request)
+        if not request.dont_filter and self.df.request_seen(request):
+            self.df.log(request, self.spider)
+            return False
+        self.network_mqs.push(request)
+        self.stats.inc_value("scheduler/enqueued/network", spider=self.spider)
+        self.stats.inc_value("scheduler/enqueued", spider=self.spider)
+        return True
+
+    def next_request(self):
+        request = super().next_request()
+        if request is None and self._has_free_slots():
+            request = self.network_mqs.pop()
+            if request is not None:
+                self.stats.inc_value("scheduler/dequeued/network", spider=self.spider)
+                self.stats.inc_value("scheduler/dequeued", spider=self.spider)
+        return request
+
+    def _get_cache(self) -> Optional[HttpCacheMiddleware]:
+        # the middleware is created by the downloader, it's disabled without HTTPCACHE
+        if not self.cache_found:
+            for middleware in self.crawler.engine.downloader.middleware.middlewares:
+                if isinstance(middleware, HttpCacheMiddleware):
+                    self.cache = middleware
+            self.cache_found = True
+        return self.cache
+
+    def _is_cache_hit(self, request) -> bool:
+        cache = self._get_cache()
+        if cache is None:
+            return False
+        policy, storage = cache.policy, cache.storage
+        if not hasattr(policy, "is_request_fresh") or not hasattr(
+            storage, "has_response"
+        ):
+            # misses can't be recognized, requests are scheduled together
+            return True
+        return (
+            policy.should_cache_request(request)
+            and policy.is_request_fresh(request)
+            and storage.has_response(self.spider, request)
+        )
+
+    def _has_free_slots(self) -> bool:
+        # requests wait in queues of slots for download delays
+        slots = self.crawler.engine.downloader.slots
+        waiting = sum(len(slot.queue) for slot in slots.values())
+        return waiting < max(1, len(slots))
@@ -11,6 +11,7 @@ BOT_NAME = "hardware_scraper"
 
 SPIDER_MODULES = ["hardware_scraper.spiders"]
 NEWSPIDER_MODULE = "hardware_scraper.spiders"
+COMMANDS_MODULE = "hardware_scraper.commands"
 
 
 # Crawl responsibly by identifying yourself (and your website) on the user-agent
@@ -20,14 +21,24 @@ NEWSPIDER_MODULE = "hardware_scraper.spiders"
 ROBOTSTXT_OBEY = False
 
 # Configure maximum concurrent requests performed by Scrapy (default: 16)
-CONCURRENT_REQUESTS = 1
+# Cache hits don't go through the download slots, so they aren't delayed, but
+# they count towards this limit with the requests waiting for delays in slots.
+# Requests to the network are kept in the scheduler (see CacheAwareScheduler),
+# so only a few of them wait in slots and cache hits aren't blocked
+CONCURRENT_REQUESTS = 128
+
+# Keep requests to the network in the priority queue until download slots
+# are free, so recent products go first
+SCHEDULER = "hardware_scraper.scheduler.CacheAwareScheduler"
 
 # Configure a delay for requests for the same website (default: 0)
 # See https://docs.scrapy.org/en/latest/topics/settings.html#download-delay
 # See also autothrottle settings and docs
+# The delay is applied per download slot: per website without proxies,
+# proxies have their own slots (see NetworkSlotMiddleware)
 DOWNLOAD_DELAY = 30
 # The download delay setting will honor only one of:
-# CONCURRENT_REQUESTS_PER_DOMAIN = 16
+CONCURRENT_REQUESTS_PER_DOMAIN = 1
 # CONCURRENT_REQUESTS_PER_IP = 16
 
 # Disable cookies (enabled by default)
@@ -44,32 +55,61 @@ DOWNLOAD_DELAY = 30
 
 # Enable or disable spider middlewares
 # See https://docs.scrapy.org/en/latest/topics/spider-middleware.html
-# SPIDER_MIDDLEWARES = {
-#     'hardware_scraper.middlewares.HardwareScraperSpiderMiddleware': 543,
-# }
+SPIDER_MIDDLEWARES = {
+    # 'hardware_scraper.middlewares.HardwareScraperSpiderMiddleware': 543,
+    # should be the closest to the spider to time only callbacks
+    "hardware_scraper.middlewares.ParseLatencyMiddleware": 990,
+}
 
 # Enable or disable downloader middlewares
 # See https://docs.scrapy.org/en/latest/topics/downloader-middleware.html
 DOWNLOADER_MIDDLEWARES = {
-    # "scrapy.downloadermiddlewares.retry.RetryMiddleware": 90,
-    # "hardware_scraper.random_proxy_middleware.RandomProxyMiddleware": 10,
-    # "scrapy.downloadermiddlewares.httpproxy.HttpProxyMiddleware": 110,
     "hardware_scraper.middlewares.TooManyRequestsRetryMiddleware": 110,
     "scrapy.downloadermiddlewares.retry.RetryMiddleware": None,
+    # proxies are set only to cache misses, HttpProxyMiddleware should go after it,
+    # exceptions get to the proxy middleware before retrying
+    # "hardware_scraper.middlewares.RandomProxyMiddleware": 930,
+    # "scrapy.downloadermiddlewares.httpproxy.HttpProxyMiddleware": 940,
+    # should be after HttpCacheMiddleware to keep wrong pages out of the cache
+    "hardware_scraper.middlewares.WrongPageMiddleware": 920,
+    # should be after HttpCacheMiddleware to process only cache misses
+    "hardware_scraper.middlewares.NetworkSlotMiddleware": 950,
     #'hardware_scraper.middlewares.HardwareScraperDownloaderMiddleware': 543,
 }
 
 # Enable or disable extensions
 # See https://docs.scrapy.org/en/latest/topics/extensions.html
-# EXTENSIONS = {
-#    'scrapy.extensions.telnet.TelnetConsole': None,
-# }
+EXTENSIONS = {
+    # 'scrapy.extensions.telnet.TelnetConsole': None,
+    "hardware_scraper.extensions.IncrementalCrawl": 500,
+    "hardware_scraper.extensions.ListingFingerprints": 500,
+    "hardware_scraper.extensions.CachedGenerations": 500,
+    "hardware_scraper.extensions.ProcessorProfiling": 500,
+    "hardware_scraper.extensions.MetricsExporter": 500,
+}
 
 # Configure item pipelines
 # See https://docs.scrapy.org/en/latest/topics/item-pipeline.html
 ITEM_PIPELINES = {
-    "hardware_scraper.pipelines.HardwareScraperPipeline": 300,
+    "hardware_scraper.pipelines.ChangeDetectionPipeline": 200,
+    "hardware_scraper.pipelines.BatchingPipeline": 300,
 }
+# Consumers of scraped items (see ItemSink), they get items by batches
+ITEM_SINKS = {
+    "hardware_scraper.pipelines.SqliteItemSink": 100,
+}
+ITEM_BATCH_SIZE = 1000
+
+# Typed columnar exports, e.g. `-O data/crawled/gpu.parquet` (requires pyarrow)
+FEED_EXPORTERS = {
+    "parquet": "hardware_scraper.exporters.ParquetItemExporter",
+    "arrow": "hardware_scraper.exporters.ArrowItemExporter",
+}
+# Write feeds without items too, so their parquet and arrow files are valid
+FEED_STORE_EMPTY = True
+
+# Log unchanged items dropped by ChangeDetectionPipeline only at DEBUG level
+LOG_FORMATTER = "hardware_scraper.logformatter.LogFormatter"
 
 # Enable and configure the AutoThrottle extension (disabled by default)
 # See https://docs.scrapy.org/en/latest/topics/autothrottle.html
@@ -90,7 +130,12 @@ HTTPCACHE_ENABLED = True
 HTTPCACHE_EXPIRATION_SECS = 0
 HTTPCACHE_DIR = "httpcache"
 HTTPCACHE_IGNORE_HTTP_CODES = [500, 502, 503, 504, 429]
-HTTPCACHE_STORAGE = "scrapy.extensions.httpcache.FilesystemCacheStorage"
+# Responses never expire, requests with `refresh_cache` meta replace them
+HTTPCACHE_POLICY = "hardware_scraper.httpcache.RefreshCachePolicy"
+# All responses are kept in a single SQLite database,
+# existing filesystem cache can be imported with `scrapy migrate_httpcache`
+HTTPCACHE_STORAGE = "hardware_scraper.httpcache.SqliteCacheStorage"
+HTTPCACHE_SQLITE_COMPRESSION_LEVEL = 6
 
 
 # Retrying
@@ -105,3 +150,64 @@ HTTPCACHE_STORAGE = "scrapy.extensions.httpcache.FilesystemCacheStorage"
 # import pathlib
 # PROXY_LIST = pathlib.Path(__file__).parent.resolve().parent.joinpath("proxies").joinpath("proxy_list.txt")
 # PROXY_MODE = 0
+# Failed proxies are cooling down for this number of seconds, it is doubled
+# for every failure in a row
+PROXY_COOLDOWN = 300
+PROXY_MAX_COOLDOWN = 3600
+# Responses with these codes lower the chance of the proxy to be chosen
+PROXY_ERROR_HTTP_CODES = [403, 407, 429]
+# Every proxy has its own download slot with this delay and concurrency,
+# so N proxies give about N times more requests, CONCURRENT_REQUESTS is raised
+# by N * PROXY_SLOT_CONCURRENCY (see RandomProxyMiddleware)
+PROXY_SLOT_DELAY = 30
+PROXY_SLOT_CONCURRENCY = 1
+
+
+# Incremental crawling
+
+# Skip detail pages scraped on previous runs, e.g. `-s INCREMENTAL_ENABLED=1`
+INCREMENTAL_ENABLED = False
+INCREMENTAL_DIR = "data/index"
+# Scrape pages again if they were scraped more than this number of days ago,
+# None means never
+INCREMENTAL_REFRESH_DAYS = None
+# Save the index every this number of scraped pages, 0 means only on close
+INCREMENTAL_SAVE_ITEMS = 100
+
+# Follow only new entries of listing pages, e.g. `-s LISTING_INDEX_ENABLED=1`,
+# listing pages aren't cached in this mode
+LISTING_INDEX_ENABLED = False
+LISTING_INDEX_DIR = "data/listing_index"
+
+# Request listing pages only of the current year and of the years that weren't
+# requested after their end, generations of other years are taken from
+# the catalog, e.g. `-s GENERATION_CATALOG_ENABLED=1`
+GENERATION_CATALOG_ENABLED = False
+GENERATION_CATALOG_DIR = "data/generation_catalog"
+# Request years again if they were requested more than this number of days ago,
+# None means never
+GENERATION_CATALOG_REFRESH_DAYS = None
+
+# Record calls, time, errors and distinct values of processors of item fields
+# into stats and a report in the directory, e.g. `-s PROCESSOR_PROFILING_ENABLED=1`
+PROCESSOR_PROFILING_ENABLED = False
+PROCESSOR_PROFILING_DIR = "data/processor_profiling"
+
+# Serve metrics of the crawl in Prometheus text format at
+# http://METRICS_HOST:METRICS_PORT/metrics, e.g. `-s METRICS_ENABLED=1`,
+# the first free port of the range is used
+METRICS_ENABLED = False
+METRICS_HOST = "127.0.0.1"
+METRICS_PORT = [9410, 9420]
+# Interval in seconds of calculation of requests and items rates
+METRICS_INTERVAL = 60
+
+# Upsert scraped items into SQLite database, e.g. `-s SQLITE_SINK_ENABLED=1`
+SQLITE_SINK_ENABLED = False
+SQLITE_SINK_PATH = "data/hardware.sqlite"
+
+# Pass only products changed since the previous crawl and write changes
+# to a separate feed, e.g. `-s CHANGES_ENABLED=1`, products are removed only if
+# they aren't on their listing pages fetched by the crawl
+CHANGES_ENABLED = False
+CHANGES_DIR = "data/changes"
@@ -0,0 +1,8 @@
+# Signals of hardware_scraper components, connected like the ones of scrapy.signals
+
+# sent by BatchingPipeline after sinks processed a batch, args: items, spider
+items_flushed = object()
+
+# sent by MetricsExporter before it renders metrics, so gauges in stats can be
+# updated (see RandomProxyMiddleware), args: spider
+metrics_requested = object()
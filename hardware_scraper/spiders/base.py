@@ -0,0 +1,208 @@
+import datetime
+import re
+
+import scrapy
+from scrapy.loader import ItemLoader
+
+from hardware_scraper.spiders.priority import get_details_priority
+from hardware_scraper.spiders.priority import get_listing_priority
+from hardware_scraper.spiders.priority import get_listing_year
+from hardware_scraper.spiders.priority import get_release_years
+from hardware_scraper.spiders.schema import record_missing_fields
+
+
+class HardwareSpider(scrapy.Spider):
+    """Base spider of TechPowerUp databases of hardware.
+
+    Listing pages are traversed by manufacturers, release years and generations,
+    every detail page gives one item. Spiders of categories supply:
+
+    - `name`, `base_url` of the database and `manufacturers`;
+    - `item_cls` (with `key_field` of full names) and `name_field` (name
+      without manufacturer) of items;
+    - `full_name_css` of product names, also the signature of detail pages;
+    - `details_extractor` and `details_schema` of tables of detail pages;
+    - `load_sections` to load values that aren't in tables.
+    """
+
+    allowed_domains = ["www.techpowerup.com"]
+    base_url: str = None
+    manufacturers = []
+    start_year = 2000
+    item_cls = None
+    name_field: str = None
+    full_name_css: str = None
+    # callback of detail pages, used to reparse cached pages
+    details_callback = "parse_details"
+    listing_signature = "select#generation"
+    # can be replaced to instrument loading of items (see ProcessorProfiling)
+    loader_cls = ItemLoader
+    # set by IncrementalCrawl, ListingFingerprints and CachedGenerations extensions
+    scraped_index = None
+    listing_index = None
+    generation_catalog = None
+    details_extractor = None
+    details_schema = None
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        # product links of fetched listing pages (see ChangeDetectionPipeline)
+        self.listed_products = {}
+
+    @property
+    def page_signatures(self):
+        # elements that should be on pages of callbacks (see WrongPageMiddleware)
+        return {
+            "parse_manufacturer_year": self.listing_signature,
+            "parse_generation": self.listing_signature,
+            "parse_details": self.full_name_css,
+        }
+
+    def start_requests(self):
+        # recent years go first, their requests get higher priorities too
+        for release_year in range(datetime.date.today().year, self.start_year - 1, -1):
+            for manufacturer in self.manufacturers:
+                # get generations for each release year,
+                # this is necessary because otherwise we can't get all the items of the page, there is a limit
+                release_date_url = f"{self.get_listing_url_prefix()}{manufacturer}&released={release_year}&sort=name"
+                # generations of past years are known from previous runs
+                generations = self._get_known_generations(manufacturer, release_year)
+                if generations is not None:
+                    self.crawler.stats.inc_value(
+                        "generation_catalog/skipped", spider=self
+                    )
+                    for generation in generations:
+                        yield self._get_generation_request(release_date_url, generation)
+                    continue
+
+                yield scrapy.Request(
+                    release_date_url,
+                    self.parse_manufacturer_year,
+                    meta=self._get_listing_meta(),
+                    priority=get_listing_priority(release_year),
+                    cb_kwargs={
+                        "manufacturer": manufacturer,
+                        "release_year": release_year,
+                    },
+                )
+
+    @classmethod
+    def get_listing_url_prefix(cls) -> str:
+        # urls of all listing pages start with it (see `scrapy cache`, `scrapy reparse`)
+        return f"{cls.base_url}/?mfgr="
+
+    def parse_manufacturer_year(self, response, manufacturer, release_year):
+        generations = response.css("select#generation option::text").getall()
+        generations = [x for x in generations if x != "All"]
+        if self.generation_catalog is not None:
+            self.generation_catalog.add(
+                manufacturer,
+                release_year,
+                [self._get_generation_name(x) for x in generations],
+            )
+        # option texts contain number of items, so changed generations are found too
+        generations = self._get_new_listing_entries(response, generations)
+
+        for option_text in sorted(generations):
+            request = self._get_generation_request(
+                response.url, self._get_generation_name(option_text)
+            )
+            self._follow_listing_entry(response, option_text, request)
+            yield request
+
+    @staticmethod
+    def _get_generation_name(option_text):
+        return re.findall(r"(.*) \(\d+\)$", option_text)[0]
+
+    def _get_generation_request(self, release_date_url, generation):
+        url = f"{release_date_url}&generation={generation}"
+        return scrapy.Request(
+            url,
+            self.parse_generation,
+            meta=self._get_listing_meta(),
+            priority=get_listing_priority(get_listing_year(url)),
+        )
+
+    def _get_known_generations(self, manufacturer, release_year):
+        # see CachedGenerations
+        if self.generation_catalog is None:
+            return None
+        return self.generation_catalog.get_generations(manufacturer, release_year)
+
+    def _get_listing_meta(self):
+        # listing pages should be fresh to find new entries (see ListingFingerprints)
+        if self.listing_index is not None:
+            return {"dont_cache": True}
+        return {}
+
+    def _get_new_listing_entries(self, response, entries):
+        if self.listing_index is None:
+            return entries
+        new_entries = self.listing_index.get_new_entries(response.url, entries)
+        self.crawler.stats.inc_value(
+            "listing_index/skipped", len(entries) - len(new_entries), spider=self
+        )
+        return new_entries
+
+    def _follow_listing_entry(self, response, entry, request):
+        # entries are saved only if their pages are done (see ListingFingerprints)
+        if self.listing_index is not None:
+            self.listing_index.follow(response.url, entry, request.url)
+
+    def parse_generation(self, response):
+        urls = response.css("table.processors tr td a::attr(href)").getall()
+        urls = [response.urljoin(url) for url in urls]
+        self.listed_products[response.url] = urls
+        if self.listing_index is not None:
+            new_urls = set(self.listing_index.get_new_entries(response.url, urls))
+        # recent and not scraped products go first
+        release_years = get_release_years(response)
+        listing_year = get_listing_year(response.url)
+        for url in sorted(urls):
+            # skip pages scraped on previous runs (see IncrementalCrawl)
+            if self.scraped_index is not None and self.scraped_index.is_fresh(url):
+                self.crawler.stats.inc_value("incremental/skipped", spider=self)
+                continue
+            seen = self.scraped_index is not None and url in self.scraped_index
+            # skip entries known from the listing page, but stale pages are refreshed
+            if self.listing_index is not None and url not in new_urls and not seen:
+                self.crawler.stats.inc_value("listing_index/skipped", spider=self)
+                continue
+            priority = get_details_priority(release_years.get(url, listing_year), seen)
+            meta = {"listing_url": response.url}
+            if seen:
+                # stale pages are downloaded again and replace the cached ones
+                meta["refresh_cache"] = True
+            request = scrapy.Request(
+                url, self.parse_details, priority=priority, meta=meta
+            )
+            self._follow_listing_entry(response, url, request)
+            yield request
+
+    def parse_details(self, response):
+        full_name = response.css(self.full_name_css).get()
+        manufacturer = full_name.split(" ")[0]
+        name = " ".join(full_name.split(" ")[1:])
+
+        sections = self.details_extractor.sections(response)
+        tables = self.details_extractor.tables(sections)
+
+        # load values
+        # the spider is used by processors to record stats
+        loader = self.loader_cls(item=self.item_cls(), response=response, spider=self)
+
+        # load model values
+        loader.add_value(self.item_cls.key_field, full_name)
+        loader.add_value("manufacturer", manufacturer)
+        loader.add_value(self.name_field, name)
+
+        # load values of tables
+        missing = self.details_schema.load(loader, tables)
+        record_missing_fields(self, missing, full_name)
+
+        self.load_sections(loader, sections)
+
+        yield loader.load_item()
+
+    def load_sections(self, loader, sections):
+        """Load values of sections `{title: element}` that aren't tables."""
@@ -0,0 +1,53 @@
+import re
+from typing import Dict
+from typing import Optional
+
+YEAR_PATTERN = re.compile(r"\b(\d{4})\b")
+LISTING_YEAR_PATTERN = re.compile(r"[?&]released=(\d{4})")
+
+# Requests of recent years go first: listing pages of a year before its detail
+# pages, detail pages of products not scraped before go before the scraped ones.
+# Priorities of years are far apart, so all pages of a year go before
+# the previous year.
+YEAR_WEIGHT = 10
+LISTING_BONUS = 8
+UNSEEN_BONUS = 5
+
+
+def get_listing_year(url: str) -> Optional[int]:
+    match = LISTING_YEAR_PATTERN.search(url)
+    return int(match.group(1)) if match is not None else None
+
+
+def get_release_years(response) -> Dict[str, int]:
+    """Get release years of pages linked in the listing table: url -> year."""
+    rows = response.css("table.processors tr")
+    header = [x.strip() for x in rows[:1].css("th::text").getall()]
+    if "Released" not in header:
+        return {}
+    column = header.index("Released")
+
+    years = {}
+    for row in rows[1:]:
+        cells = row.css("td")
+        if len(cells) <= column:
+            continue
+        match = YEAR_PATTERN.search(" ".join(cells[column].css("::text").getall()))
+        if match is None:
+            continue
+        for url in row.css("td a::attr(href)").getall():
+            years[response.urljoin(url)] = int(match.group(1))
+    return years
+
+
+def get_listing_priority(year: Optional[int]) -> int:
+    if year is None:
+        return 0
+    return year * YEAR_WEIGHT + LISTING_BONUS
+
+
+def get_details_priority(year: Optional[int], seen: bool) -> int:
+    priority = 0 if seen else UNSEEN_BONUS
+    if year is not None:
+        priority += year * YEAR_WEIGHT
+    return priority
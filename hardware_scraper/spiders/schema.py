@@ -0,0 +1,69 @@
+from typing import Dict
+from typing import List
+from typing import Tuple
+from typing import Union
+
+# keys of a field in a table, only one of them can be on the page
+Keys = Union[str, List[str]]
+# title of a section or titles of alternative sections, the first found is used
+Sections = Union[str, Tuple[str, ...]]
+
+
+class DetailsSchema:
+    """Declarative mapping of tables of detail pages to fields of items.
+
+    The mapping `{section: {field: key or [keys]}}` is compiled on creation into
+    a plan of tuples `(sections, [(field, keys)])`, so loading an item is one pass
+    over the plan with dict lookups.
+    """
+
+    def __init__(self, mapping: Dict[Sections, Dict[str, Keys]]):
+        self.plan: List[Tuple[Tuple[str, ...], List[Tuple[str, Tuple[str, ...]]]]]
+        self.plan = []
+        for sections, fields in mapping.items():
+            if isinstance(sections, str):
+                sections = (sections,)
+            entries = []
+            for field, keys in fields.items():
+                if isinstance(keys, str):
+                    keys = [keys]
+                entries.append((field, tuple(keys)))
+            self.plan.append((sections, entries))
+
+    @staticmethod
+    def _get_table(tables, sections) -> Dict[str, str]:
+        for section in sections:
+            table = tables.get(section)
+            if table is not None:
+                return table
+        return {}
+
+    def load(self, loader, tables: Dict[str, Dict[str, str]]) -> List[str]:
+        """Add values of tables to the loader, returns fields without values."""
+        missing = []
+        for sections, entries in self.plan:
+            table = self._get_table(tables, sections)
+            for field, keys in entries:
+                values = [table[key] for key in keys if key in table]
+                if len(values) == 1:
+                    loader.add_value(field, values[0])
+                elif values:
+                    raise ValueError(
+                        f"Many keys are possible for field: {field}, keys: {list(keys)}"
+                    )
+                else:
+                    missing.append(field)
+        return missing
+
+
+def record_missing_fields(spider, missing: List[str], full_name: str):
+    """Count fields without values in stats `missing_fields/<field>`."""
+    if not missing:
+        return
+    spider.logger.debug(f"No info on fields: {missing} on {full_name}")
+    # spiders of reparse and benchmark_parsers commands aren't bound to crawlers
+    crawler = getattr(spider, "crawler", None)
+    if crawler is None:
+        return
+    for field in missing:
+        crawler.stats.inc_value(f"missing_fields/{field}", spider=spider)
@@ -1,29 +1,56 @@
-def find_table(sections, table_name, css):
-    try:
-        return next(
-            iter(
-                section
-                for section in sections
-                if section.css(css).get().strip() == table_name
-            )
-        )
-    except StopIteration:
-        return None
-
-
-def load_table_dict(loader, key_mapping, table_dict, full_name, logger):
-    for key in key_mapping:
-        dict_keys = key_mapping[key]
-        if not isinstance(dict_keys, list):
-            dict_keys = [dict_keys]
-
-        dict_values = [table_dict.get(x) for x in dict_keys]
-        dict_values = [x for x in dict_values if x is not None]
-        if len(dict_values) == 1:
-            loader.add_value(key, dict_values[0])
-        elif len(dict_values) > 0:
-            raise ValueError(
-                f"Many keys are possible for key: {key}, dict_keys: {dict_keys}"
-            )
-        else:
-            logger.info(f"No info on key: {key} on {full_name}")
+from typing import Dict
+
+from lxml import etree
+from parsel import css2xpath
+
+
+def compile_css(css):
+    return etree.XPath(css2xpath(css))
+
+
+def serialize(node):
+    # the same serialization as `Selector.get`
+    if isinstance(node, str):
+        return str(node)
+    return etree.tostring(node, method="html", encoding="unicode", with_tail=False)
+
+
+class DetailsExtractor:
+    """Extracts `section.details` tables of a detail page in a single pass.
+
+    All selectors are compiled once, every section is visited once and the result
+    is a mapping `{section_title: {key: raw_html_value}}`.
+    """
+
+    _sections_xpath = compile_css("section.details")
+
+    def __init__(self, title_css, keys_css, values_css):
+        self._title_xpath = compile_css(title_css)
+        self._keys_xpath = compile_css(keys_css)
+        self._values_xpath = compile_css(values_css)
+
+    def sections(self, response) -> Dict[str, etree._Element]:
+        sections = {}
+        for section in self._sections_xpath(response.selector.root):
+            titles = self._title_xpath(section)
+            if not titles:
+                continue
+            # the first section with the given title wins
+            sections.setdefault(titles[0].strip(), section)
+        return sections
+
+    def table_dict(self, section) -> Dict[str, str]:
+        if section is None:
+            return {}
+
+        keys = [str(key).strip().rstrip(":") for key in self._keys_xpath(section)]
+        values = [serialize(value).strip() for value in self._values_xpath(section)]
+
+        table_dict = {key: value for key, value in zip(keys, values)}
+        return table_dict
+
+    def tables(self, sections) -> Dict[str, Dict[str, str]]:
+        return {title: self.table_dict(section) for title, section in sections.items()}
+
+    def extract(self, response) -> Dict[str, Dict[str, str]]:
+        return self.tables(self.sections(response))
@@ -0,0 +1,58 @@
+import datetime
+
+from scrapy.utils.test import get_crawler
+
+from hardware_scraper.benchmark import load_fixtures
+from hardware_scraper.extensions.incremental import ScrapedIndex
+from hardware_scraper.extensions.listing import ListingIndex
+from hardware_scraper.spiders.gpu_spider import GPUSpider
+
+
+def get_listed_urls(response):
+    urls = response.css("table.processors tr td a::attr(href)").getall()
+    return sorted(response.urljoin(url) for url in urls)
+
+
+def test_stale_pages_of_unchanged_listing_pages_are_refreshed(tmp_path):
+    spider = GPUSpider.from_crawler(get_crawler(GPUSpider))
+    response = load_fixtures(spider.name, "listing")[0]
+    urls = get_listed_urls(response)
+    fresh_url, stale_url, unindexed_url = urls[:3]
+
+    # the listing page is the same as on the previous run
+    spider.listing_index = ListingIndex(tmp_path.joinpath("listing.json"))
+    spider.listing_index.get_new_entries(response.url, urls)
+    spider.listing_index.save()
+    spider.listing_index.load()
+
+    spider.scraped_index = ScrapedIndex(
+        tmp_path.joinpath("index.json"), refresh_days=30
+    )
+    for url in urls:
+        spider.scraped_index.add(url)
+    spider.scraped_index.scraped[stale_url] -= datetime.timedelta(days=31)
+    del spider.scraped_index.scraped[unindexed_url]
+
+    requests = list(spider.parse_generation(response))
+    assert [request.url for request in requests] == [stale_url]
+    assert requests[0].meta["refresh_cache"]
+    assert fresh_url not in spider.listing_index.followed.get(response.url, {})
+
+    stats = spider.crawler.stats
+    assert stats.get_value("incremental/skipped") == len(urls) - 2
+    assert stats.get_value("listing_index/skipped") == 1
+
+
+def test_new_entries_of_listing_pages_are_followed(tmp_path):
+    spider = GPUSpider.from_crawler(get_crawler(GPUSpider))
+    response = load_fixtures(spider.name, "listing")[0]
+    urls = get_listed_urls(response)
+
+    spider.listing_index = ListingIndex(tmp_path.joinpath("listing.json"))
+    spider.listing_index.get_new_entries(response.url, urls[1:])
+    spider.listing_index.save()
+    spider.listing_index.load()
+
+    requests = list(spider.parse_generation(response))
+    assert [request.url for request in requests] == urls[:1]
+    assert "refresh_cache" not in requests[0].meta
@@ -0,0 +1,81 @@
+import json
+
+from scrapy import Request
+from scrapy.exceptions import DropItem
+from scrapy.http import HtmlResponse
+from scrapy.utils.test import get_crawler
+
+from hardware_scraper.items import GPUItem
+from hardware_scraper.pipelines.change_detection_pipeline import (
+    ChangeDetectionPipeline,
+)
+from hardware_scraper.spiders.gpu_spider import GPUSpider
+
+LISTING_URL = "https://www.techpowerup.com/gpu-specs/?released=2020&generation=A"
+OTHER_LISTING_URL = "https://www.techpowerup.com/gpu-specs/?released=2020&generation=B"
+DETAILS_URL = "https://www.techpowerup.com/gpu-specs/{name}"
+
+
+def crawl(directory, products, listings, failed=()):
+    """Pass products `{name: listing url}` through the pipeline like a crawl.
+
+    Listing pages `{url: [names]}` are fetched, pages of failed products are
+    requested, but don't give items.
+    """
+    crawler = get_crawler(GPUSpider)
+    spider = GPUSpider()
+    spider.listed_products = {
+        url: [DETAILS_URL.format(name=name) for name in names]
+        for url, names in listings.items()
+    }
+    pipeline = ChangeDetectionPipeline(directory=directory, stats=crawler.stats)
+    pipeline.open_spider(spider)
+    for name, listing_url in products.items():
+        if name in failed:
+            continue
+        url = DETAILS_URL.format(name=name)
+        response = HtmlResponse(
+            url, request=Request(url, meta={"listing_url": listing_url})
+        )
+        item = GPUItem(gpu_full_name=name)
+        try:
+            pipeline.process_item(item, spider)
+        except DropItem as exception:
+            pipeline.item_dropped(item, response, exception, spider)
+        else:
+            pipeline.item_scraped(item, response, spider)
+    pipeline.spider_closed(spider, "finished")
+    with open(pipeline.feed_file.name) as feed:
+        return {(change["change"], change["key"]) for change in map(json.loads, feed)}
+
+
+def test_removed_products_are_not_on_fetched_listing_pages(tmp_path):
+    products = {"a": LISTING_URL, "b": LISTING_URL, "c": OTHER_LISTING_URL}
+    listings = {LISTING_URL: ["a", "b"], OTHER_LISTING_URL: ["c"]}
+    assert crawl(tmp_path, products, listings) == {
+        ("added", "a"),
+        ("added", "b"),
+        ("added", "c"),
+    }
+
+    # "a" is still listed, but its page failed, "c" is on a listing page
+    # which isn't fetched (failed or skipped), "b" is removed from the site
+    changes = crawl(
+        tmp_path,
+        {"a": LISTING_URL, "c": OTHER_LISTING_URL},
+        {LISTING_URL: ["a"]},
+        failed={"a", "c"},
+    )
+    assert changes == {("removed", "b")}
+
+    # products that failed before aren't added again
+    assert crawl(tmp_path, products, listings) == {("added", "b")}
+
+
+def test_skipped_products_are_not_removed(tmp_path):
+    products = {"a": LISTING_URL, "b": LISTING_URL}
+    listings = {LISTING_URL: ["a", "b"]}
+    crawl(tmp_path, products, listings)
+    # products skipped by incremental and listing index modes aren't requested
+    assert crawl(tmp_path, {}, listings) == set()
+    assert crawl(tmp_path, products, listings) == set()
@@ -0,0 +1,127 @@
+import datetime
+from html.entities import html5
+
+import pytest
+from bs4 import BeautifulSoup
+from dateutil import parser
+
+from hardware_scraper.benchmark import load_fixtures
+from hardware_scraper.items import extract_text_from_tags
+from hardware_scraper.items import normalize_release_date
+from hardware_scraper.items import parse_known_release_date
+from hardware_scraper.spiders.cpu_spider import CPUSpider
+from hardware_scraper.spiders.gpu_spider import GPUSpider
+from hardware_scraper.spiders.utils import serialize
+
+
+def get_fixture_fragments():
+    # values of tables and features of detail pages like they get to processors
+    fragments = []
+    for spider_cls in (CPUSpider, GPUSpider):
+        spider = spider_cls()
+        for response in load_fixtures(spider.name, "detail"):
+            sections = spider.details_extractor.sections(response)
+            tables = spider.details_extractor.tables(sections)
+            for table in tables.values():
+                fragments.extend(table.values())
+            features = sections.get("Features")
+            if features is not None:
+                fragments.extend(serialize(x) for x in features.xpath(".//li"))
+    return fragments
+
+
+EDGE_CASES = [
+    "plain text",
+    "  \n  ",
+    "<b>bold</b> <i>italic</i>",
+    "<div>  \n  </div><span> </span>",
+    "<br/>  <br>\n<br>",
+    '<a href="/cpu-specs/?a=1&b=2" title="x>y">link</a>',
+    "<a href='x>y'>t</a>",
+    "<!-- comment --> text",
+    "<script>var a = '<b>';</script>text<style>b {}</style>",
+    "<SCRIPT>x</SCRIPT>y",
+    "<!DOCTYPE html>doc<?pi x?>",
+    "<![CDATA[cdata]]>after",
+    "<pre>  a\n\n  b  </pre>",
+    "<pre>\n\n</pre><pre><b>\n \n</b></pre>",
+    "<textarea>  \n  </textarea><textarea><b>t</b></textarea>",
+    "<b><i>nested</b>wrong</i>",
+    "<p>unclosed<p>paragraphs",
+    "<b>x<b",
+    "a < b > c",
+    "x <3 y",
+    "</ b>x",
+    "<1>x",
+    "a</&amp;<a href='x>y'>b",
+    "a &amp; b &lt;c&gt; &nbsp;x &#39; &#x41; &copy;",
+    "&copy &amp b &ampb a&amp",
+    "&unknown; &foo &",
+    "&#65 &#x42 &#150; &#0; &#xD800; &#x110000; &#128;",
+    "&lang; &rang; &AMP; &Amp;",
+]
+ENTITIES = [f"a&{name}b" for name in html5 if name.endswith(";")]
+REFERENCES = [f"&#{code};&#x{code:x};" for code in range(300)]
+
+
+@pytest.mark.parametrize(
+    "value", get_fixture_fragments() + EDGE_CASES + ENTITIES + REFERENCES
+)
+def test_extract_text_from_tags_matches_beautifulsoup(value):
+    expected = BeautifulSoup(value, "html.parser").get_text()
+    assert extract_text_from_tags(value) == expected
+
+
+def get_fixture_release_dates():
+    dates = []
+    for spider_cls in (CPUSpider, GPUSpider):
+        spider = spider_cls()
+        for response in load_fixtures(spider.name, "detail"):
+            sections = spider.details_extractor.sections(response)
+            tables = spider.details_extractor.tables(sections)
+            for table in tables.values():
+                if "Release Date" in table:
+                    dates.append(extract_text_from_tags(table["Release Date"]))
+    return dates
+
+
+RELEASE_DATES = [
+    "Jan 7th, 2019",
+    "Feb 1st, 2000",
+    "Mar 2nd, 2021",
+    "Apr 3rd, 2022",
+    "Sep 22nd, 2023",
+    "Sept 30th, 2019",
+    "Dec 31st, 1999",
+    "Feb 29th, 2020",
+    "December 1, 2018",
+    "Jan. 2019",
+    "Feb 2019",
+    "Feb 2020",
+    "Sept 2019",
+    "June 2019",
+    "2019",
+]
+
+
+@pytest.mark.parametrize("value", get_fixture_release_dates() + RELEASE_DATES)
+def test_known_release_dates_match_dateutil(value):
+    assert parse_known_release_date(value) == parser.parse(value).date()
+
+
+class NextDay(datetime.date):
+    # `datetime.date` is replaced by this class in tests
+    next_day = datetime.date.today() + datetime.timedelta(days=1)
+
+    @classmethod
+    def today(cls):
+        return cls.next_day
+
+
+@pytest.mark.parametrize("value", ["Jan 2019", "2019", "March, 2019"])
+def test_cached_release_dates_take_missing_parts_from_current_day(value, monkeypatch):
+    normalize_release_date(value)
+    monkeypatch.setattr(datetime, "date", NextDay)
+    default = datetime.datetime.combine(NextDay.today(), datetime.time())
+    date, _ = normalize_release_date(value)
+    assert date == parser.parse(value, default=default).date().isoformat()